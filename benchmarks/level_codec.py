@@ -0,0 +1,61 @@
+import argparse
+import random
+import time
+
+from lockpicker.level import MAX_HEIGHT, NUMBER_OF_PICKS
+from lockpicker.level.level import Level
+from lockpicker.tumbler.base import BaseTumbler
+from lockpicker.tumbler.location import Location
+from lockpicker.tumbler.tumbler import Tumbler
+
+
+def create_synthetic_level(tumblers: int = 1000, bindings: int = 1000, seed: int = 0) -> Level:
+    rng = random.Random(seed)
+    locations = [Location(index // 2, bool(index % 2)) for index in range(tumblers)]
+    level = Level.create(NUMBER_OF_PICKS, MAX_HEIGHT)
+    for location in locations:
+        height = rng.randint(1, MAX_HEIGHT - 1)
+        base = BaseTumbler(location, rng.randint(0, 9), height, MAX_HEIGHT, rng.randint(0, 2), rng.random() < 0.1)
+        level.add_tumbler(Tumbler(base))
+
+    for _ in range(bindings):
+        level.add_binding(rng.choice(locations), rng.choice(locations), rng.choice([-2, -1, 1, 2]))
+
+    return level
+
+
+def measure(function, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Level serialization round-trip benchmark.")
+    parser.add_argument("--tumblers", type=int, default=1000, help="Number of tumblers in the synthetic level")
+    parser.add_argument("--bindings", type=int, default=1000, help="Number of bindings in the synthetic level")
+    parser.add_argument("--repeat", type=int, default=100, help="Number of repetitions")
+    args = parser.parse_args()
+
+    level = create_synthetic_level(args.tumblers, args.bindings)
+    data = level.serialize()
+    decoded = level.deserialize(data)
+    assert decoded.serialize() == data, "Round trip changed the level"
+
+    timings = {
+        "serialize_tumblers": measure(level.serialize_tumblers, args.repeat),
+        "serialize_bindings": measure(level.serialize_bindings, args.repeat),
+        "deserialize_tumblers": measure(
+            lambda: Level.deserialize_tumblers(data.serialized_tumblers, level.max_height), args.repeat
+        ),
+        "deserialize_bindings": measure(lambda: Level.deserialize_bindings(data.serialized_bindings), args.repeat),
+        "round_trip": measure(lambda: level.deserialize(level.serialize()), args.repeat),
+    }
+    for name, elapsed in timings.items():
+        print(f"{name:<24}{elapsed * 1000:>10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
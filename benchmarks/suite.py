@@ -0,0 +1,241 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Callable, ContextManager, Dict, List, NamedTuple
+
+from benchmarks.level_codec import create_synthetic_level
+from lockpicker.agents.random import play_random_games
+from lockpicker.array_lock import ArrayLock
+from lockpicker.level.level import Level
+from lockpicker.lock import Lock
+
+LEVELS_DIRECTORY = Path(__file__).parent.parent / "levels"
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+TOLERANCE = 0.25
+REPEAT = 5
+REFERENCE_SIZE = 1000
+
+BENCHMARKS: Dict[str, Callable[[], "Benchmark"]] = {}
+
+
+class Benchmark(NamedTuple):
+    function: Callable[[], None]
+    operations: int
+    context: ContextManager = contextlib.nullcontext()
+
+
+def benchmark(function: Callable[[], Benchmark]) -> Callable[[], Benchmark]:
+    BENCHMARKS[function.__name__] = function
+    return function
+
+
+def load_levels() -> List[Level]:
+    return [Level.load(path) for path in sorted(LEVELS_DIRECTORY.glob("*.lvl"))]
+
+
+def record_states(lock, moves: int, seed: int = 0) -> list:
+    random.seed(seed)
+    lock.reset()
+    states = []
+    for _ in range(moves):
+        lock.play_random_move()
+        if lock.check_win():
+            lock.reset()
+        states.append(lock.snapshot())
+
+    lock.reset()
+    return states
+
+
+@benchmark
+def level_load() -> Benchmark:
+    paths = sorted(LEVELS_DIRECTORY.glob("*.lvl"))
+    return Benchmark(lambda: [Level.load(path) for path in paths], len(paths))
+
+
+@benchmark
+def level_save() -> Benchmark:
+    levels = load_levels()
+    directory = tempfile.TemporaryDirectory()
+
+    def save():
+        with contextlib.redirect_stdout(io.StringIO()):
+            for index, level in enumerate(levels):
+                level.save(os.path.join(directory.name, f"{index}.lvl"))
+
+    return Benchmark(save, len(levels), directory)
+
+
+@benchmark
+def level_copy() -> Benchmark:
+    levels = load_levels()
+    return Benchmark(lambda: [level.copy() for level in levels], len(levels))
+
+
+@benchmark
+def large_level_round_trip() -> Benchmark:
+    level = create_synthetic_level(1000, 1000)
+    return Benchmark(lambda: level.deserialize(level.serialize()), 1)
+
+
+@benchmark
+def large_level_copy() -> Benchmark:
+    level = create_synthetic_level(1000, 1000)
+    return Benchmark(level.copy, 1)
+
+
+def push_release(lock_class) -> Benchmark:
+    lock = lock_class(Level.load(LEVELS_DIRECTORY / "level_01_09.lvl"))
+    random.seed(0)
+    moves = []
+    for _ in range(1000):
+        move = lock.play_random_move()
+        if move is not None:
+            moves.append(move)
+    lock.reset()
+
+    def play():
+        lock.reset()
+        for pick, location in moves:
+            lock.select_pick(pick)
+            lock.push(location)
+            lock.release_current_pick()
+
+    return Benchmark(play, len(moves))
+
+
+@benchmark
+def lock_push_release() -> Benchmark:
+    return push_release(Lock)
+
+
+@benchmark
+def array_lock_push_release() -> Benchmark:
+    return push_release(ArrayLock)
+
+
+def possible_moves(lock_class) -> Benchmark:
+    lock = lock_class(Level.load(LEVELS_DIRECTORY / "level_01_09.lvl"))
+    states = record_states(lock, 1000)
+
+    def generate():
+        for state in states:
+            lock.restore(state)
+            lock.get_possible_moves()
+
+    return Benchmark(generate, len(states))
+
+
+@benchmark
+def lock_possible_moves() -> Benchmark:
+    return possible_moves(Lock)
+
+
+@benchmark
+def array_lock_possible_moves() -> Benchmark:
+    return possible_moves(ArrayLock)
+
+
+@benchmark
+def random_games() -> Benchmark:
+    lock = ArrayLock(Level.load(LEVELS_DIRECTORY / "level_01_09.lvl"))
+
+    def play():
+        random.seed(0)
+        play_random_games(lock, games=100, progress=False)
+
+    return Benchmark(play, 100)
+
+
+def game_draw(full: bool) -> Benchmark:
+    import pygame
+
+    from lockpicker.constants.gui import HEIGHT, WIDTH
+    from lockpicker.game.game import Game
+    from lockpicker.game.replay import headless_display
+
+    with contextlib.ExitStack() as display:
+        display.enter_context(headless_display())
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        game = Game(screen, Lock(Level.load(LEVELS_DIRECTORY / "level_01_09.lvl")))
+        game.mouse_pos = (-1, -1)
+
+        def draw():
+            if full:
+                game.renderer.invalidate()
+            game.draw()
+
+        return Benchmark(draw, 1, display.pop_all())
+
+
+@benchmark
+def game_draw_full() -> Benchmark:
+    return game_draw(full=True)
+
+
+@benchmark
+def game_draw_incremental() -> Benchmark:
+    return game_draw(full=False)
+
+
+def reference() -> Benchmark:
+    values = list(range(REFERENCE_SIZE))
+    return Benchmark(lambda: sorted(values, key=lambda value: -value), REFERENCE_SIZE)
+
+
+def measure(setup: Callable[[], Benchmark], repeat: int = REPEAT) -> float:
+    function, operations, context = setup()
+    with context:
+        timer = timeit.Timer(function)
+        number, _ = timer.autorange()
+        return min(timer.repeat(repeat, number)) / number / operations
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="LockPicker benchmark suite. Baselines store costs relative to a reference workload."
+    )
+    parser.add_argument("names", nargs="*", help=f"Benchmarks to run, all by default: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Path of the baseline file")
+    parser.add_argument("--save", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="Allowed slowdown before failing")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="Number of timing repetitions")
+    args = parser.parse_args()
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(unknown)}")
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    unit = measure(reference, args.repeat)
+    results = {}
+    regressions = []
+    for name in args.names or BENCHMARKS:
+        time = measure(BENCHMARKS[name], args.repeat)
+        results[name] = time / unit
+        line = f"{name:<28}{time * 1e6:>14.2f} us/op{results[name]:>12.1f} units "
+        if name in baseline:
+            ratio = results[name] / baseline[name]
+            line += f"{ratio:>10.2f}x baseline"
+            if ratio > 1 + args.tolerance:
+                regressions.append(name)
+                line += "  REGRESSION"
+        print(line)
+
+    if args.save:
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline saved to {args.baseline}.")
+    elif regressions:
+        print(f"Regressions: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
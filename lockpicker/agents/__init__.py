@@ -0,0 +1,2 @@
+GAMES = 1000
+MAX_MOVES = 100
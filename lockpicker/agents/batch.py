@@ -0,0 +1,36 @@
+from typing import Optional
+
+import numpy as np
+
+from lockpicker.agents import MAX_MOVES
+from lockpicker.batch_lock import BatchLock
+from lockpicker.level.level import Level
+
+BATCH_SIZE = 10_000
+PLAYOUTS = 100_000
+
+
+def estimate_solve_rate(
+    level: Level,
+    games: int = PLAYOUTS,
+    max_moves: int = MAX_MOVES,
+    batch_size: int = BATCH_SIZE,
+    seed: Optional[int] = None,
+) -> float:
+    rng = np.random.default_rng(seed)
+    wins = 0
+    for start in range(0, games, batch_size):
+        size = min(batch_size, games - start)
+        lock = BatchLock(level, size, seed=rng.integers(2**63))
+        won = lock.check_win()
+        for _ in range(max_moves):
+            rows = np.flatnonzero(~won)
+            if not len(rows):
+                break
+
+            lock.play_random_moves(rows)
+            won |= lock.check_win()
+
+        wins += int(won.sum())
+
+    return wins / games if games else 0.0
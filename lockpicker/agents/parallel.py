@@ -0,0 +1,89 @@
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Type, Union
+
+from lockpicker.agents import GAMES, MAX_MOVES
+from lockpicker.agents.result import AgentResult
+from lockpicker.agents.trace import minimize_trace
+from lockpicker.array_lock import ArrayLock
+from lockpicker.level.level import Level
+from lockpicker.lock import Lock
+
+_stop_event = None
+
+
+def play_parallel_random_games(
+    level: Level,
+    games: int = GAMES,
+    max_moves: int = MAX_MOVES,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    stop_on_win: bool = True,
+    lock_class: Type[Union[Lock, ArrayLock]] = ArrayLock,
+) -> AgentResult:
+    workers = workers or os.cpu_count() or 1
+    seeds = random.Random(seed).sample(range(2**32), workers)
+    chunks = [games // workers + (worker < games % workers) for worker in range(workers)]
+
+    result = AgentResult()
+    start = time.perf_counter()
+    stop_event = multiprocessing.Event()
+    with ProcessPoolExecutor(workers, initializer=_initialize_worker, initargs=(stop_event,)) as executor:
+        futures = [
+            executor.submit(_play_games, level, chunk, max_moves, worker_seed, stop_on_win, lock_class)
+            for chunk, worker_seed in zip(chunks, seeds)
+            if chunk > 0
+        ]
+        for future in futures:
+            result.merge(future.result())
+
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def _initialize_worker(stop_event):
+    global _stop_event
+    _stop_event = stop_event
+
+
+def _play_games(
+    level: Level,
+    games: int,
+    max_moves: int,
+    seed: int,
+    stop_on_win: bool,
+    lock_class: Type[Union[Lock, ArrayLock]],
+) -> AgentResult:
+    random.seed(seed)
+    lock = lock_class(level)
+    result = AgentResult()
+    start = time.perf_counter()
+    for _ in range(games):
+        if _stop_event is not None and _stop_event.is_set():
+            break
+
+        lock.reset()
+        result.games += 1
+        trace = []
+        for number_of_moves in range(1, max_moves + 1):
+            move = lock.play_random_move()
+            result.moves += 1
+            if move is not None:
+                trace.append(move)
+            if lock.check_win():
+                result.wins += 1
+                result.moves_to_win.append(number_of_moves)
+                if result.trace is None:
+                    result.trace = minimize_trace(lock, trace)
+                break
+
+        if result.wins and stop_on_win:
+            if _stop_event is not None:
+                _stop_event.set()
+            break
+
+    result.elapsed = time.perf_counter() - start
+    return result
@@ -1,17 +1,35 @@
+import time
+from typing import Union
+
 from tqdm import tqdm
 
+from lockpicker.agents import GAMES, MAX_MOVES
+from lockpicker.agents.result import AgentResult
+from lockpicker.agents.trace import minimize_trace
+from lockpicker.array_lock import ArrayLock
 from lockpicker.lock import Lock
 
-GAMES = 1000
-MAX_MOVES = 100
-
 
-def play_random_games(lock: Lock, games: int = GAMES, max_moves: int = MAX_MOVES) -> bool:
-    for _ in tqdm(range(games)):
+def play_random_games(
+    lock: Union[Lock, ArrayLock], games: int = GAMES, max_moves: int = MAX_MOVES, progress: bool = True
+) -> AgentResult:
+    result = AgentResult()
+    start = time.perf_counter()
+    for _ in tqdm(range(games), disable=not progress):
         lock.reset()
-        for _ in range(max_moves):
-            lock.play_random_move()
+        result.games += 1
+        trace = []
+        for number_of_moves in range(1, max_moves + 1):
+            move = lock.play_random_move()
+            result.moves += 1
+            if move is not None:
+                trace.append(move)
             if lock.check_win():
-                return True
+                result.wins += 1
+                result.moves_to_win.append(number_of_moves)
+                result.trace = minimize_trace(lock, trace)
+                result.elapsed = time.perf_counter() - start
+                return result
 
-    return False
+    result.elapsed = time.perf_counter() - start
+    return result
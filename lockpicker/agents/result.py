@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from lockpicker.solver.solution import Move
+
+
+@dataclass
+class AgentResult:
+    games: int = 0
+    moves: int = 0
+    wins: int = 0
+    moves_to_win: List[int] = field(default_factory=list)
+    trace: Optional[List[Move]] = None
+    elapsed: float = 0.0
+
+    def merge(self, other: "AgentResult"):
+        self.games += other.games
+        self.moves += other.moves
+        self.wins += other.wins
+        self.moves_to_win.extend(other.moves_to_win)
+        if self.trace is None:
+            self.trace = other.trace
+
+    @property
+    def solved(self) -> bool:
+        return self.wins > 0
+
+    @property
+    def mean_moves_to_win(self) -> Optional[float]:
+        return sum(self.moves_to_win) / len(self.moves_to_win) if self.moves_to_win else None
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed if self.elapsed > 0 else 0.0
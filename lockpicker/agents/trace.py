@@ -0,0 +1,38 @@
+from typing import Dict, List, Tuple, Union
+
+from lockpicker.array_lock import ArrayLock
+from lockpicker.lock import Lock
+from lockpicker.solver.solution import Move
+
+
+def minimize_trace(lock: Union[Lock, ArrayLock], moves: List[Move]) -> List[Move]:
+    initial_state = lock.snapshot()
+    lock.reset()
+    try:
+        trace = []
+        positions = [_get_position(lock)]
+        visited: Dict[Tuple, int] = {positions[0]: 0}
+        for pick, location in moves:
+            lock.select_pick(pick)
+            lock.push(location)
+            position = _get_position(lock)
+            index = visited.get(position)
+            if index is None:
+                trace.append((pick, location))
+                positions.append(position)
+                visited[position] = len(trace)
+                continue
+
+            for removed in positions[index + 1 :]:
+                del visited[removed]
+            del positions[index + 1 :]
+            del trace[index:]
+
+        return trace
+    finally:
+        lock.restore(initial_state)
+
+
+def _get_position(lock: Union[Lock, ArrayLock]) -> Tuple:
+    state = lock.snapshot()
+    return state.tumblers, state.picks
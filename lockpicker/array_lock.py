@@ -0,0 +1,350 @@
+import random
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from lockpicker.level.level import Level
+from lockpicker.solver.solution import Move, MoveSequenceResult
+from lockpicker.state.state import State
+from lockpicker.state.zobrist import ZobristHash
+from lockpicker.tumbler.location import Location
+
+
+class ArrayLock:
+    def __init__(self, level: Level):
+        self._level = level
+        self._level.validate()
+
+        tumblers = [tumbler for tumbler in level.tumblers.values() if tumbler is not None]
+        self._indices: Dict[Location, int] = {tumbler.location: index for index, tumbler in enumerate(tumblers)}
+        self._locations = [tumbler.location for tumbler in tumblers]
+        self._max_height = level.max_height
+        self._number_of_picks = level.number_of_picks
+
+        self._base_height = [tumbler.base_height for tumbler in tumblers]
+        self._post_release_height = [tumbler.post_release_height for tumbler in tumblers]
+        self._master = [tumbler.master for tumbler in tumblers]
+        self._position = [tumbler.position for tumbler in tumblers]
+        self._upper = [tumbler.upper for tumbler in tumblers]
+        self._counter = [self._indices.get(location.counter, -1) for location in self._locations]
+        self._group_members = [[self._indices[loc] for loc in level.groups[tumbler.group]] for tumbler in tumblers]
+        self._bindings = [
+            [(self._indices[loc], difference) for loc, difference in level.bindings.get(location, {}).items()]
+            for location in self._locations
+        ]
+
+        width = max(self._position, default=-1) + 1
+        self._rows = {upper: [-1] * width for upper in (True, False)}
+        for index, location in enumerate(self._locations):
+            self._rows[location.upper][location.position] = index
+
+        self._previous = [
+            [index for index in self._rows[location.upper][: location.position] if index >= 0]
+            for location in self._locations
+        ]
+        self._previous_counters = [
+            [index for index in self._rows[not location.upper][: location.position + 1] if index >= 0]
+            for location in self._locations
+        ]
+        self._row_pairs = [
+            (self._rows[upper], self._rows[not upper], [Location(position, upper) for position in range(width)])
+            for upper in (True, False)
+        ]
+
+        self._height = [tumbler.height for tumbler in tumblers]
+        self._pushed = [tumbler.pushed for tumbler in tumblers]
+        self._jammed = [tumbler.jammed for tumbler in tumblers]
+        self._released = [tumbler.state.release for tumbler in tumblers]
+        self._difference = [tumbler.difference for tumbler in tumblers]
+
+        self._picks = [-1] * self._number_of_picks
+        self._current_pick = 0
+        self._initial_state = self.snapshot()
+        self._zobrist: Optional[ZobristHash] = None
+        self._zobrist_indices: List[int] = []
+        self._keys = [0] * len(self._locations)
+
+    def push(self, location: Location):
+        index = self._indices.get(location, -1)
+        self.release_current_pick()
+        if index >= 0 and self._check_previous_tumblers(index):
+            self._push_tumbler(index)
+
+    def release_current_pick(self):
+        index = self._picks[self._current_pick]
+        if index >= 0:
+            self._set_pick(self._current_pick, -1)
+            self._release_tumbler(index)
+            self._revise_picks()
+
+    def apply_moves(self, moves: Iterable[Move], fast_forward: bool = False) -> MoveSequenceResult:
+        applied = 0
+        for index, (pick, location) in enumerate(moves):
+            if not 0 <= pick < self._number_of_picks or location not in self.get_possible_moves():
+                return MoveSequenceResult(applied, illegal=index)
+
+            self.select_pick(pick)
+            self.push(location)
+            applied += 1
+            if self.check_win():
+                return MoveSequenceResult(applied, win=index)
+
+        return MoveSequenceResult(applied)
+
+    def reset(self):
+        self.restore(self._initial_state)
+
+    def snapshot(self) -> State:
+        tumblers = tuple(zip(self._height, self._pushed, self._jammed, self._released, self._difference))
+        picks = tuple(self._locations[index] if index >= 0 else None for index in self._picks)
+        return State(tumblers, picks, self._current_pick)
+
+    def restore(self, state: State):
+        if len(state.tumblers) != len(self._locations) or len(state.picks) != self._number_of_picks:
+            raise ValueError("State does not match the layout of this lock")
+
+        if state.tumblers:
+            height, pushed, jammed, release, difference = zip(*state.tumblers)
+            self._height[:] = height
+            self._pushed[:] = pushed
+            self._jammed[:] = jammed
+            self._released[:] = release
+            self._difference[:] = difference
+
+        self._picks = [self._indices[location] if location is not None else -1 for location in state.picks]
+        self._current_pick = state.current_pick
+        if self._zobrist is not None:
+            self._compute_hash()
+
+    def get_hash(self) -> int:
+        if self._zobrist is None:
+            differences = [abs(difference) for bindings in self._bindings for _, difference in bindings]
+            self._zobrist = ZobristHash(
+                self._locations, self._number_of_picks, self._max_height, max(differences, default=0)
+            )
+            self._zobrist_indices = [self._zobrist.index(location) for location in self._locations]
+            self._compute_hash()
+
+        return self._zobrist.value
+
+    def play_random_move(self) -> Optional[Tuple[int, Location]]:
+        moves = self.get_possible_moves()
+        if moves:
+            move = random.choice(moves)
+            pick = random.choice(range(self._number_of_picks))
+            self.select_pick(pick)
+            self.push(move)
+            return pick, move
+
+        return None
+
+    def check_win(self) -> bool:
+        return max(self._height, default=1) <= 1
+
+    def get_possible_moves(self) -> List[Location]:
+        moves = []
+        heights = self._height
+        for row, counter_row, locations in self._row_pairs:
+            last_position = -1
+            counter_height = -1
+            for position, index in enumerate(row):
+                counter = counter_row[position]
+                if counter >= 0 and heights[counter] > counter_height:
+                    counter_height = heights[counter]
+                if index >= 0:
+                    if counter_height < 0 or heights[index] + counter_height < self._max_height:
+                        last_position = position
+                    if heights[index] > 1:
+                        break
+
+            moves.extend(locations[: last_position + 1])
+
+        return moves
+
+    def get_pick(self, pick: int) -> Optional[Location]:
+        index = self._picks[pick]
+        return self._locations[index] if index >= 0 else None
+
+    def get_height(self, location: Location) -> int:
+        return self._height[self._indices[location]]
+
+    def get_heights(self) -> Dict[Location, int]:
+        return dict(zip(self._locations, self._height))
+
+    def change_current_pick(self):
+        self._current_pick = (self._current_pick + 1) % self._number_of_picks
+
+    def select_pick(self, pick: int):
+        self._current_pick = pick
+
+    def _recalculate_current_height(self, index: int):
+        if self._pushed[index]:
+            height = 1
+        else:
+            height = self._base_height[index] + self._difference[index] + self._post_release_height[index]
+
+        counter = self._counter[index]
+        limit = self._max_height - self._height[counter] if counter >= 0 else self._max_height
+        if height > limit:
+            height = limit
+        self._height[index] = height if height > 1 else 1
+        if self._zobrist is not None:
+            self._update_hash(index)
+
+    def _jam(self, index: int):
+        self._released[index] = False
+        self._jammed[index] = True
+        self._pushed[index] = True
+        if self._zobrist is not None:
+            self._update_hash(index)
+
+    def _release(self, index: int, direct: bool = False):
+        self._jammed[index] = False
+        self._pushed[index] = False
+        self._released[index] = direct
+        if direct:
+            self._difference[index] = 0
+
+        self._recalculate_current_height(index)
+
+    def _set_difference(self, index: int, difference: int, recalculate: bool = True):
+        self._difference[index] = difference
+        if recalculate:
+            self._recalculate_current_height(index)
+        elif self._zobrist is not None:
+            self._update_hash(index)
+
+    def _push_tumbler(self, index: int):
+        self._set_pick(self._current_pick, index)
+        if self._jammed[index]:
+            self._released[index] = False
+            self._jammed[index] = False
+            if self._zobrist is not None:
+                self._update_hash(index)
+            return
+
+        self._jammed[index] = False
+        self._released[index] = False
+        self._pushed[index] = True
+        self._recalculate_current_height(index)
+
+        self._apply_bindings_iteratively(index, pushed=True)
+        self._apply_master_tumbler(index)
+
+    def _release_tumbler(self, index: int):
+        if not self._jammed[index] and not self._has_other_picks(index):
+            self._release(index, direct=True)
+
+        self._apply_bindings_iteratively(index, pushed=False)
+
+    def _check_previous_tumblers(self, index: int) -> bool:
+        heights = self._height
+        for tumbler in self._previous[index]:
+            if heights[tumbler] > 1:
+                return False
+
+        limit = self._max_height - heights[index]
+        for counter in self._previous_counters[index]:
+            if heights[counter] >= limit:
+                return False
+
+        return True
+
+    def _apply_bindings(self, index: int, pushed: bool):
+        source_pushed = self._pushed[index]
+        source_jammed = self._jammed[index]
+        for target, difference in self._bindings[index]:
+            if pushed and self._has_other_picks(target):
+                self._jam(target)
+                continue
+
+            self._set_difference(target, difference if source_pushed else 0, not source_jammed)
+            if pushed and not source_jammed:
+                self._release(target)
+
+    def _apply_bindings_iteratively(self, index: int, pushed: bool):
+        self._apply_bindings(index, pushed)
+        if not self._revise_picks():
+            self._apply_bindings(index, pushed)
+
+    def _apply_master_tumbler(self, index: int):
+        if self._master[index] and self._pushed[index]:
+            for member in self._group_members[index]:
+                self._jam(member)
+                self._set_difference(member, 0)
+
+    def _has_other_picks(self, index: int) -> bool:
+        current_pick = self._current_pick
+        for pick, tumbler in enumerate(self._picks):
+            if tumbler == index and pick != current_pick:
+                return True
+
+        return False
+
+    def _check_if_pick_is_valid(self, pick: int) -> bool:
+        index = self._picks[pick]
+        if index >= 0:
+            heights = self._height
+            for tumbler in self._previous[index]:
+                if heights[tumbler] > 1:
+                    return False
+
+        return True
+
+    def _set_pick(self, pick: int, index: int):
+        zobrist = self._zobrist
+        if zobrist is not None:
+            indices = self._zobrist_indices
+            previous = self._picks[pick]
+            previous = indices[previous] if previous >= 0 else -1
+            current = indices[index] if index >= 0 else -1
+            zobrist.value ^= zobrist.pick_key(pick, previous) ^ zobrist.pick_key(pick, current)
+
+        self._picks[pick] = index
+
+    def _update_hash(self, index: int):
+        key = self._zobrist.tumbler_key(
+            self._zobrist_indices[index],
+            self._height[index],
+            self._pushed[index],
+            self._jammed[index],
+            self._released[index],
+            self._difference[index],
+        )
+        self._zobrist.value ^= self._keys[index] ^ key
+        self._keys[index] = key
+
+    def _compute_hash(self):
+        zobrist = self._zobrist
+        zobrist.value = 0
+        for index in range(len(self._locations)):
+            self._keys[index] = 0
+            self._update_hash(index)
+        for pick, index in enumerate(self._picks):
+            zobrist.value ^= zobrist.pick_key(pick, self._zobrist_indices[index] if index >= 0 else -1)
+
+    def _revise_picks(self) -> bool:
+        all_picks_valid = False
+        number_of_revisions = 0
+        while not all_picks_valid:
+            all_picks_valid = True
+            number_of_revisions += 1
+            for pick in range(self._number_of_picks):
+                if not self._check_if_pick_is_valid(pick):
+                    all_picks_valid = False
+                    index = self._picks[pick]
+                    self._apply_bindings(index, False)
+                    self._set_pick(pick, -1)
+                    self._release_tumbler(index)
+
+        return number_of_revisions == 1
+
+    @property
+    def current_pick(self) -> int:
+        return self._current_pick
+
+    @property
+    def level(self) -> Level:
+        return self._level
+
+    @property
+    def locations(self) -> Tuple[Location, ...]:
+        return tuple(self._locations)
@@ -0,0 +1,291 @@
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+from lockpicker.level.level import Level
+from lockpicker.tumbler.location import Location
+
+
+class TumblerCells(NamedTuple):
+    height: np.ndarray
+    pushed: np.ndarray
+    jammed: np.ndarray
+    released: np.ndarray
+    difference: np.ndarray
+
+
+class BatchLock:
+    def __init__(self, level: Level, size: int, seed: Optional[int] = None):
+        level.validate()
+        self._level = level
+        self._size = size
+        self._rng = np.random.default_rng(seed)
+
+        tumblers = [tumbler for tumbler in level.tumblers.values() if tumbler is not None]
+        indices = {tumbler.location: index for index, tumbler in enumerate(tumblers)}
+        self._locations = [tumbler.location for tumbler in tumblers]
+        self._number_of_tumblers = sentinel = len(tumblers)
+        self._number_of_picks = level.number_of_picks
+        self._max_height = level.max_height
+
+        self._base_height = np.array([tumbler.base_height for tumbler in tumblers] + [0], dtype=np.int32)
+        self._post_release_height = np.array(
+            [tumbler.post_release_height for tumbler in tumblers] + [0], dtype=np.int32
+        )
+        self._master = np.array([tumbler.master for tumbler in tumblers] + [False], dtype=bool)
+        self._counter = np.array([indices.get(location.counter, sentinel) for location in self._locations] + [sentinel])
+
+        width = max((location.position for location in self._locations), default=-1) + 1
+        self._rows = {upper: np.full(width, -1, dtype=np.intp) for upper in (True, False)}
+        for index, location in enumerate(self._locations):
+            self._rows[location.upper][location.position] = index
+
+        def row_prefix(upper: bool, end: int) -> List[int]:
+            return [index for index in self._rows[upper][:end] if index >= 0]
+
+        self._previous = self._pad(
+            [row_prefix(location.upper, location.position) for location in self._locations], sentinel
+        )
+        self._previous_counters = self._pad(
+            [row_prefix(not location.upper, location.position + 1) for location in self._locations], sentinel
+        )
+        self._group_members = self._pad(
+            [[indices[loc] for loc in level.groups[tumbler.group]] for tumbler in tumblers], sentinel
+        )
+        bindings = [list(level.bindings.get(location, {}).items()) for location in self._locations]
+        self._binding_targets = self._pad([[indices[loc] for loc, _ in binding] for binding in bindings], sentinel)
+        self._binding_differences = self._pad([[difference for _, difference in binding] for binding in bindings], 0)
+
+        shape = (size, sentinel + 1)
+        self._initial_height = np.array([tumbler.height for tumbler in tumblers] + [0], dtype=np.int32)
+        self._height = np.empty(shape, dtype=np.int32)
+        self._pushed = np.empty(shape, dtype=bool)
+        self._jammed = np.empty(shape, dtype=bool)
+        self._released = np.empty(shape, dtype=bool)
+        self._difference = np.empty(shape, dtype=np.int32)
+        self._picks = np.empty((size, self._number_of_picks), dtype=np.intp)
+        self._current_pick = np.empty(size, dtype=np.intp)
+        self._stride = sentinel + 1
+        self._cells = TumblerCells(
+            self._height.reshape(-1),
+            self._pushed.reshape(-1),
+            self._jammed.reshape(-1),
+            self._released.reshape(-1),
+            self._difference.reshape(-1),
+        )
+        self.reset()
+
+    def reset(self, rows: Optional[np.ndarray] = None):
+        rows = np.arange(self._size) if rows is None else rows
+        self._height[rows] = self._initial_height
+        self._pushed[rows] = False
+        self._jammed[rows] = False
+        self._released[rows] = False
+        self._difference[rows] = 0
+        self._picks[rows] = -1
+        self._current_pick[rows] = 0
+
+    def check_win(self) -> np.ndarray:
+        return (self._height <= 1).all(axis=1)
+
+    def get_number_of_moves(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        upper, lower = self._get_last_positions(np.arange(self._size) if rows is None else rows)
+        return upper + lower + 2
+
+    def play_random_moves(self, rows: Optional[np.ndarray] = None):
+        rows = np.arange(self._size) if rows is None else rows
+        last_upper, last_lower = self._get_last_positions(rows)
+        number_of_moves = last_upper + last_lower + 2
+        playable = number_of_moves > 0
+        rows = rows[playable]
+        last_upper = last_upper[playable]
+        number_of_moves = number_of_moves[playable]
+
+        moves = (self._rng.random(len(rows)) * number_of_moves).astype(np.intp)
+        upper = moves <= last_upper
+        positions = np.where(upper, moves, moves - last_upper - 1)
+        indices = np.where(upper, self._rows[True][positions], self._rows[False][positions])
+        self.select_pick(rows, self._rng.integers(self._number_of_picks, size=len(rows)))
+        self.push(rows, indices)
+
+    def select_pick(self, rows: np.ndarray, picks: np.ndarray):
+        self._current_pick[rows] = picks
+
+    def push(self, rows: np.ndarray, indices: np.ndarray):
+        self.release_current_pick(rows)
+        pushable = indices >= 0
+        rows, indices = rows[pushable], indices[pushable]
+        pushable = self._check_previous_tumblers(rows, indices)
+        self._push_tumbler(rows[pushable], indices[pushable])
+
+    def release_current_pick(self, rows: np.ndarray):
+        current_pick = self._current_pick[rows]
+        indices = self._picks[rows, current_pick]
+        picked = indices >= 0
+        rows, indices, current_pick = rows[picked], indices[picked], current_pick[picked]
+        self._picks[rows, current_pick] = -1
+        self._release_tumbler(rows, indices)
+        self._revise_picks(rows)
+
+    def get_index(self, location: Location) -> int:
+        return self._locations.index(location)
+
+    def _get_last_positions(self, rows: np.ndarray):
+        heights = self._height[rows]
+        last_positions = []
+        for upper in (True, False):
+            row, counter_row = self._rows[upper], self._rows[not upper]
+            last_position = np.full(len(rows), -1, dtype=np.intp)
+            counter_height = np.zeros(len(rows), dtype=np.int32)
+            counter_seen = False
+            reachable = np.ones(len(rows), dtype=bool)
+            for position in range(len(row)):
+                if counter_row[position] >= 0:
+                    np.maximum(counter_height, heights[:, counter_row[position]], out=counter_height)
+                    counter_seen = True
+                if row[position] >= 0:
+                    height = heights[:, row[position]]
+                    legal = height + counter_height < self._max_height if counter_seen else True
+                    last_position[reachable & legal] = position
+                    reachable &= height <= 1
+
+            last_positions.append(last_position)
+
+        return last_positions
+
+    def _recalculate_current_height(self, rows: np.ndarray, indices: np.ndarray):
+        cells = rows * self._stride + indices
+        unpushed = self._base_height[indices] + self._cells.difference[cells] + self._post_release_height[indices]
+        height = np.where(self._cells.pushed[cells], 1, unpushed)
+        limit = self._max_height - self._cells.height[rows * self._stride + self._counter[indices]]
+        self._cells.height[cells] = np.maximum(1, np.minimum(height, limit))
+
+    def _jam(self, rows: np.ndarray, indices: np.ndarray):
+        cells = rows * self._stride + indices
+        self._cells.released[cells] = False
+        self._cells.jammed[cells] = True
+        self._cells.pushed[cells] = True
+
+    def _release(self, rows: np.ndarray, indices: np.ndarray, direct: bool = False):
+        cells = rows * self._stride + indices
+        self._cells.jammed[cells] = False
+        self._cells.pushed[cells] = False
+        self._cells.released[cells] = direct
+        if direct:
+            self._cells.difference[cells] = 0
+
+        self._recalculate_current_height(rows, indices)
+
+    def _push_tumbler(self, rows: np.ndarray, indices: np.ndarray):
+        self._picks[rows, self._current_pick[rows]] = indices
+        cells = rows * self._stride + indices
+        self._cells.released[cells] = False
+        jammed = self._cells.jammed[cells]
+        self._cells.jammed[cells] = False
+
+        rows, indices = rows[~jammed], indices[~jammed]
+        self._cells.pushed[cells[~jammed]] = True
+        self._recalculate_current_height(rows, indices)
+
+        self._apply_bindings_iteratively(rows, indices, pushed=True)
+        self._apply_master_tumbler(rows, indices)
+
+    def _release_tumbler(self, rows: np.ndarray, indices: np.ndarray):
+        cells = rows * self._stride + indices
+        releasable = ~self._cells.jammed[cells] & ~self._has_other_picks(rows, indices)
+        self._release(rows[releasable], indices[releasable], direct=True)
+        self._apply_bindings_iteratively(rows, indices, pushed=False)
+
+    def _check_previous_tumblers(self, rows: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        offsets = (rows * self._stride)[:, None]
+        previous_free = (self._cells.height[offsets + self._previous[indices]] <= 1).all(axis=1)
+        limit = self._max_height - self._cells.height[rows * self._stride + indices]
+        previous_counters = self._previous_counters[indices]
+        counters = self._cells.height[offsets + previous_counters]
+        counters_below = (counters < limit[:, None]) | (previous_counters == self._number_of_tumblers)
+        return previous_free & counters_below.all(axis=1)
+
+    def _apply_bindings(self, rows: np.ndarray, indices: np.ndarray, pushed: bool):
+        cells = rows * self._stride + indices
+        source_pushed = self._cells.pushed[cells]
+        source_jammed = self._cells.jammed[cells]
+        for slot in range(self._binding_targets.shape[1]):
+            targets = self._binding_targets[indices, slot]
+            bound = targets != self._number_of_tumblers
+            slot_rows, targets = rows[bound], targets[bound]
+            differences = np.where(source_pushed[bound], self._binding_differences[indices[bound], slot], 0)
+            recalculate = ~source_jammed[bound]
+
+            if pushed:
+                jammed = self._has_other_picks(slot_rows, targets)
+                self._jam(slot_rows[jammed], targets[jammed])
+                slot_rows, targets = slot_rows[~jammed], targets[~jammed]
+                differences, recalculate = differences[~jammed], recalculate[~jammed]
+
+            self._cells.difference[slot_rows * self._stride + targets] = differences
+            self._recalculate_current_height(slot_rows[recalculate], targets[recalculate])
+            if pushed:
+                self._release(slot_rows[recalculate], targets[recalculate])
+
+    def _apply_bindings_iteratively(self, rows: np.ndarray, indices: np.ndarray, pushed: bool):
+        self._apply_bindings(rows, indices, pushed)
+        revised = ~self._revise_picks(rows)
+        self._apply_bindings(rows[revised], indices[revised], pushed)
+
+    def _apply_master_tumbler(self, rows: np.ndarray, indices: np.ndarray):
+        master = self._master[indices] & self._cells.pushed[rows * self._stride + indices]
+        rows, indices = rows[master], indices[master]
+        for slot in range(self._group_members.shape[1]):
+            members = self._group_members[indices, slot]
+            member = members != self._number_of_tumblers
+            slot_rows, members = rows[member], members[member]
+            self._jam(slot_rows, members)
+            self._cells.difference[slot_rows * self._stride + members] = 0
+            self._recalculate_current_height(slot_rows, members)
+
+    def _has_other_picks(self, rows: np.ndarray, indices: np.ndarray) -> np.ndarray:
+        other_picks = np.arange(self._number_of_picks) != self._current_pick[rows, None]
+        return ((self._picks[rows] == indices[:, None]) & other_picks).any(axis=1)
+
+    def _check_if_pick_is_valid(self, rows: np.ndarray, pick: int) -> np.ndarray:
+        indices = self._picks[rows, pick]
+        previous = self._previous[np.where(indices >= 0, indices, self._number_of_tumblers)]
+        return (self._cells.height[(rows * self._stride)[:, None] + previous] <= 1).all(axis=1)
+
+    def _revise_picks(self, rows: np.ndarray) -> np.ndarray:
+        first_revision_valid = None
+        while first_revision_valid is None or len(rows):
+            all_picks_valid = np.ones(len(rows), dtype=bool)
+            for pick in range(self._number_of_picks):
+                invalid = ~self._check_if_pick_is_valid(rows, pick)
+                if invalid.any():
+                    all_picks_valid &= ~invalid
+                    invalid_rows = rows[invalid]
+                    indices = self._picks[invalid_rows, pick]
+                    self._apply_bindings(invalid_rows, indices, False)
+                    self._picks[invalid_rows, pick] = -1
+                    self._release_tumbler(invalid_rows, indices)
+
+            if first_revision_valid is None:
+                first_revision_valid = all_picks_valid
+
+            rows = rows[~all_picks_valid]
+
+        return first_revision_valid
+
+    @staticmethod
+    def _pad(lists: List[List[int]], fill: int) -> np.ndarray:
+        width = max((len(values) for values in lists), default=0)
+        padded = np.full((len(lists) + 1, width), fill, dtype=np.intp)
+        for index, values in enumerate(lists):
+            padded[index, : len(values)] = values
+
+        return padded
+
+    @property
+    def level(self) -> Level:
+        return self._level
+
+    @property
+    def size(self) -> int:
+        return self._size
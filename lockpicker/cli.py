@@ -0,0 +1,383 @@
+import argparse
+import math
+import sys
+import time
+import warnings
+from pathlib import Path
+from typing import List, Optional
+
+from lockpicker.agents import GAMES, MAX_MOVES
+from lockpicker.array_lock import ArrayLock
+from lockpicker.level import BINDINGS, CANDIDATE_STATES, DENSITY, POSITIONS
+from lockpicker.level.level import Level
+from lockpicker.lock import Lock
+from lockpicker.solver import MAX_STATES
+from lockpicker.solver.heuristics import HEURISTICS
+from lockpicker.solver.solution import Move
+from lockpicker.solver.solve import SOLVERS, solve
+from lockpicker.tumbler.location import Location
+
+ENGINES = {"array": ArrayLock, "object": Lock}
+
+
+def format_moves(moves: Optional[List[Move]]) -> str:
+    if moves is None:
+        return "-"
+
+    return " ".join(f"{pick}:{location.position}{'U' if location.upper else 'L'}" for pick, location in moves)
+
+
+def parse_moves(text: str) -> List[Move]:
+    moves = []
+    for token in text.split():
+        pick, _, location = token.partition(":")
+        if not pick.isdigit() or len(location) < 2 or not location[:-1].isdigit() or location[-1] not in "UL":
+            raise ValueError(f"Invalid move: {token}")
+
+        moves.append((int(pick), Location(int(location[:-1]), location[-1] == "U")))
+
+    return moves
+
+
+def find_levels(paths: List[Path], pattern: str = "*.lvl") -> List[Path]:
+    levels = []
+    for path in paths:
+        levels.extend(sorted(path.glob(pattern)) if path.is_dir() else [path])
+
+    return levels
+
+
+def run_solve(args: argparse.Namespace) -> int:
+    status = 0
+    for path in args.levels:
+        lock = ENGINES[args.engine](Level.load(path))
+        start = time.perf_counter()
+        solution = solve(lock, args.solver, args.heuristic, max_states=args.max_states)
+        elapsed = time.perf_counter() - start
+
+        if not solution.solvable:
+            status = 1
+        result = "solved" if solution.solvable else "unsolved" if solution.complete else "unknown"
+        print(f"{path}: {result}, length {solution.length}, expanded {solution.expanded}, {elapsed:.3f}s")
+        if args.moves and solution.solvable:
+            print(f"  {format_moves(solution.moves)}")
+
+    return status
+
+
+def run_random(args: argparse.Namespace) -> int:
+    from lockpicker.agents.parallel import play_parallel_random_games
+
+    status = 0
+    for path in args.levels:
+        result = play_parallel_random_games(
+            Level.load(path),
+            games=args.games,
+            max_moves=args.max_moves,
+            workers=args.workers,
+            seed=args.seed,
+            lock_class=ENGINES[args.engine],
+        )
+        if not result.solved:
+            status = 1
+        print(f"{path}: {result.wins}/{result.games} wins, {result.moves} moves, {result.elapsed:.3f}s")
+        if args.moves and result.solved:
+            print(f"  {format_moves(result.trace)}")
+
+    return status
+
+
+def run_verify(args: argparse.Namespace) -> int:
+    lock = ENGINES[args.engine](Level.load(args.level))
+    status = 0
+    with open(args.solutions) as file:
+        for number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+
+            try:
+                moves = parse_moves(line)
+            except ValueError as error:
+                status = 1
+                print(f"{args.solutions}:{number}: {error}")
+                continue
+
+            lock.reset()
+            result = lock.apply_moves(moves, fast_forward=True)
+            if result.solved:
+                print(f"{args.solutions}:{number}: solved at move {result.win + 1}")
+                continue
+
+            status = 1
+            if not result.legal:
+                print(
+                    f"{args.solutions}:{number}: illegal move {result.illegal + 1} ({format_moves([moves[result.illegal]])})"
+                )
+            else:
+                print(f"{args.solutions}:{number}: not solved after {result.applied} moves")
+
+    return status
+
+
+def run_validate(args: argparse.Namespace) -> int:
+    status = 0
+    for path in args.levels:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            try:
+                if args.header_only:
+                    Level.read_header(path)
+                else:
+                    Level.load(path).validate()
+            except (AssertionError, OSError, ValueError) as error:
+                status = 1
+                print(f"{path}: invalid {error!r}")
+                continue
+
+        messages = "; ".join(str(warning.message) for warning in caught)
+        print(f"{path}: valid" + (f" ({messages})" if messages else ""))
+
+    return status
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    import json
+
+    from lockpicker.solver.report import solve_levels, summarize
+
+    start = time.perf_counter()
+    reports = solve_levels(
+        find_levels(args.levels),
+        workers=args.workers,
+        solver=args.solver,
+        heuristic=args.heuristic,
+        max_states=args.max_states,
+        lock_class=ENGINES[args.engine],
+        validate_only=args.validate_only,
+    )
+    summary = {"solver": args.solver, "heuristic": args.heuristic, "engine": args.engine}
+    summary.update(summarize(reports, time.perf_counter() - start))
+
+    if args.output is None:
+        json.dump(summary, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w") as file:
+            json.dump(summary, file, indent=2)
+
+    return int(summary["invalid"] > 0 or summary["unsolvable"] > 0)
+
+
+def run_pack(args: argparse.Namespace) -> int:
+    from lockpicker.level.pack import pack_levels
+
+    pack_levels(find_levels(args.levels), args.output)
+    return 0
+
+
+def run_unpack(args: argparse.Namespace) -> int:
+    from lockpicker.level.pack import unpack_levels
+
+    unpack_levels(args.pack, args.directory)
+    return 0
+
+
+def run_replay(args: argparse.Namespace) -> int:
+    from lockpicker.game.replay import render_levels
+
+    results = render_levels(
+        find_levels(args.levels),
+        args.output,
+        frame_format=args.format,
+        fps=args.fps,
+        solver=args.solver,
+        heuristic=args.heuristic,
+        max_states=args.max_states,
+        workers=args.workers,
+    )
+    for path, frames in results:
+        print(f"{path}: {'unsolvable' if frames is None else f'{frames} frames'}")
+
+    return int(any(frames is None for _, frames in results))
+
+
+def run_profile(args: argparse.Namespace) -> int:
+    import random
+
+    from lockpicker.instrumentation import LockProfiler, format_stats
+
+    random.seed(args.seed)
+    for path in args.levels:
+        lock = ENGINES[args.engine](Level.load(path))
+        with LockProfiler(lock) as profiler:
+            if args.solver is not None:
+                solve(lock, args.solver, args.heuristic, max_states=args.max_states)
+            else:
+                for _ in range(args.games):
+                    lock.reset()
+                    for _ in range(args.max_moves):
+                        lock.play_random_move()
+                        if lock.check_win():
+                            break
+
+        print(f"{path}:")
+        print(format_stats(profiler.stats, profiler.stats["push"].calls))
+
+    return 0
+
+
+def run_generate(args: argparse.Namespace) -> int:
+    from lockpicker.level.generator import GeneratorSettings, generate_levels
+
+    settings = GeneratorSettings(
+        positions=args.positions,
+        groups=args.groups,
+        density=args.density,
+        bindings=args.bindings,
+        min_length=args.min_length,
+        max_length=args.max_length,
+        min_branching=args.min_branching,
+        max_branching=args.max_branching,
+        max_states=args.max_states,
+    )
+    start = time.perf_counter()
+    levels = generate_levels(args.count, settings, max_candidates=args.candidates, workers=args.workers, seed=args.seed)
+    args.directory.mkdir(parents=True, exist_ok=True)
+    for index, generated in enumerate(levels, 1):
+        path = args.directory / f"generated_{index:04d}.lvl"
+        generated.level.save(path)
+        print(f"{path}: length {generated.length}, branching {generated.branching:.2f}, seed {generated.seed}")
+
+    print(f"Generated {len(levels)}/{args.count} levels in {time.perf_counter() - start:.3f}s")
+    return int(len(levels) < args.count)
+
+
+def run_analyze(args: argparse.Namespace) -> int:
+    from lockpicker.solver.difficulty import analyze
+
+    status = 0
+    for path in find_levels(args.levels):
+        start = time.perf_counter()
+        report = analyze(ENGINES[args.engine](Level.load(path)), args.max_states, args.max_moves)
+        elapsed = time.perf_counter() - start
+        if not report.complete:
+            status = 1
+            print(f"{path}: more than {report.states} states, {elapsed:.3f}s")
+            continue
+
+        print(
+            f"{path}: {report.states} states, length {report.length}, {report.solutions} optimal solutions, "
+            f"{report.dead_ends:.1%} dead ends, P(win in {report.max_moves}) {report.solve_probability:.6f}, "
+            f"P(win) {report.eventual_probability:.6f}, {elapsed:.3f}s"
+        )
+
+    return status
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="lockpicker", description="Headless LockPicker tools.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    solve_parser = subparsers.add_parser("solve", help="Find the shortest solution of each level")
+    solve_parser.add_argument("levels", nargs="+", type=Path, help="Paths to the level files")
+    solve_parser.set_defaults(function=run_solve)
+
+    random_parser = subparsers.add_parser("random", help="Play random games on each level")
+    random_parser.add_argument("levels", nargs="+", type=Path, help="Paths to the level files")
+    random_parser.add_argument("--games", type=int, default=GAMES, help="Number of games per level")
+    random_parser.add_argument("--max_moves", type=int, default=MAX_MOVES, help="Move limit per game")
+    random_parser.add_argument("--workers", type=int, default=1, help="Number of worker processes")
+    random_parser.add_argument("--seed", type=int, default=None, help="Master seed")
+    random_parser.set_defaults(function=run_random)
+
+    verify_parser = subparsers.add_parser("verify", help="Check recorded solutions against a level")
+    verify_parser.add_argument("level", type=Path, help="Path to the level file")
+    verify_parser.add_argument("solutions", type=Path, help="File with one solution per line, e.g. 0:1U 1:2L")
+    verify_parser.set_defaults(function=run_verify)
+
+    validate_parser = subparsers.add_parser("validate", help="Check that each level loads and is consistent")
+    validate_parser.add_argument("levels", nargs="+", type=Path, help="Paths to the level files")
+    validate_parser.add_argument("--header_only", action="store_true", help="Check headers without decompressing")
+    validate_parser.set_defaults(function=run_validate)
+
+    batch_parser = subparsers.add_parser("batch", help="Solve every level in parallel and write a JSON report")
+    batch_parser.add_argument("levels", nargs="+", type=Path, help="Level files or directories of .lvl files")
+    batch_parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    batch_parser.add_argument("--validate_only", action="store_true", help="Only load and validate the levels")
+    batch_parser.add_argument("--output", type=Path, default=None, help="Report path (stdout by default)")
+    batch_parser.set_defaults(function=run_batch)
+
+    pack_parser = subparsers.add_parser("pack", help="Convert .lvl files into a single level pack")
+    pack_parser.add_argument("levels", nargs="+", type=Path, help="Level files or directories of .lvl files")
+    pack_parser.add_argument("--output", type=Path, required=True, help="Path of the level pack")
+    pack_parser.set_defaults(function=run_pack)
+
+    unpack_parser = subparsers.add_parser("unpack", help="Convert a level pack back into .lvl files")
+    unpack_parser.add_argument("pack", type=Path, help="Path of the level pack")
+    unpack_parser.add_argument("--directory", type=Path, required=True, help="Output directory for the .lvl files")
+    unpack_parser.set_defaults(function=run_unpack)
+
+    replay_parser = subparsers.add_parser("replay", help="Render solution replays offscreen to PNG or raw RGB frames")
+    replay_parser.add_argument("levels", nargs="+", type=Path, help="Level files or directories of .lvl files")
+    replay_parser.add_argument("--output", type=Path, required=True, help="Output directory")
+    replay_parser.add_argument("--format", choices=["png", "rgb"], default="png", help="Frame format")
+    replay_parser.add_argument("--fps", type=int, default=60, help="Frames per second of animation time")
+    replay_parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    replay_parser.set_defaults(function=run_replay)
+
+    profile_parser = subparsers.add_parser("profile", help="Break down the engine cost of random play or a search")
+    profile_parser.add_argument("levels", nargs="+", type=Path, help="Paths to the level files")
+    profile_parser.add_argument("--games", type=int, default=100, help="Number of random games per level")
+    profile_parser.add_argument("--max_moves", type=int, default=MAX_MOVES, help="Move limit per game")
+    profile_parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    profile_parser.add_argument("--solver", choices=SOLVERS, default=None, help="Profile a search instead")
+    profile_parser.set_defaults(function=run_profile)
+
+    generate_parser = subparsers.add_parser("generate", help="Generate levels within a difficulty band")
+    generate_parser.add_argument("--directory", type=Path, required=True, help="Output directory for the .lvl files")
+    generate_parser.add_argument("--count", type=int, default=10, help="Number of levels to generate")
+    generate_parser.add_argument("--candidates", type=int, default=None, help="Candidate budget (1000 per level)")
+    generate_parser.add_argument("--positions", type=int, default=POSITIONS, help="Number of tumbler positions")
+    generate_parser.add_argument("--groups", type=int, default=1, help="Maximum number of tumbler groups")
+    generate_parser.add_argument("--density", type=float, default=DENSITY, help="Probability of a tumbler per slot")
+    generate_parser.add_argument("--bindings", type=int, default=BINDINGS, help="Number of sampled bindings")
+    generate_parser.add_argument("--min_length", type=int, default=1, help="Minimum optimal solution length")
+    generate_parser.add_argument("--max_length", type=int, default=100, help="Maximum optimal solution length")
+    generate_parser.add_argument("--min_branching", type=float, default=0.0, help="Minimum mean branching factor")
+    generate_parser.add_argument("--max_branching", type=float, default=math.inf, help="Maximum mean branching factor")
+    generate_parser.add_argument("--max_states", type=int, default=CANDIDATE_STATES, help="Search budget per candidate")
+    generate_parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    generate_parser.add_argument("--seed", type=int, default=None, help="Master seed")
+    generate_parser.set_defaults(function=run_generate)
+
+    analyze_parser = subparsers.add_parser("analyze", help="Compute difficulty metrics from the full state graph")
+    analyze_parser.add_argument("levels", nargs="+", type=Path, help="Level files or directories of .lvl files")
+    analyze_parser.add_argument("--max_moves", type=int, default=MAX_MOVES, help="Move limit of the random agent")
+    analyze_parser.add_argument("--max_states", type=int, default=MAX_STATES, help="State graph budget")
+    analyze_parser.set_defaults(function=run_analyze)
+
+    for subparser in (solve_parser, batch_parser, replay_parser):
+        subparser.add_argument("--solver", choices=SOLVERS, default="bfs", help="Search algorithm")
+
+    for subparser in (solve_parser, batch_parser, replay_parser, profile_parser):
+        subparser.add_argument(
+            "--heuristic", choices=list(HEURISTICS), default="unsolved", help="Heuristic for A*/IDA*"
+        )
+        subparser.add_argument("--max_states", type=int, default=MAX_STATES, help="Search budget in states")
+
+    for subparser in (solve_parser, random_parser, verify_parser, batch_parser, profile_parser, analyze_parser):
+        subparser.add_argument("--engine", choices=list(ENGINES), default="array", help="Lock implementation")
+
+    for subparser in (solve_parser, random_parser):
+        subparser.add_argument("--moves", action="store_true", help="Print the winning moves")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = create_parser().parse_args(argv)
+    return args.function(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
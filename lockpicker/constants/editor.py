@@ -0,0 +1 @@
+HISTORY_LIMIT = 1000
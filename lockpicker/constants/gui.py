@@ -20,4 +20,9 @@ ARROW_SIZE = 16
 ARROW_COLOR = (0xC0, 0x80, 0x80)
 ARROW_WIDTH = 2
 
-ANIMATION_SPEED = 0.05
+FPS = 60
+MAX_REPLAY_FRAMES = 100_000
+ANIMATION_SPEED = 3.0
+
+SPRITE_CACHE_SIZE = 512
+MAX_DIRTY_RECTS = 32
@@ -1,12 +1,12 @@
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import pygame
 
 from lockpicker.constants.gui import (
-    BACKGROUND_COLOR,
     BAR_OFFSET,
     BAR_WIDTH,
     BAR_Y_OFFSET,
+    FPS,
     HEIGHT,
     HIGHLIGHT_COLOR,
     PICK_COLORS,
@@ -19,16 +19,23 @@ from lockpicker.constants.gui import (
     WIDTH,
     X_OFFSET,
 )
+from lockpicker.game.renderer import Renderer
 from lockpicker.lock import Lock
 from lockpicker.tumbler.location import Location
 from lockpicker.tumbler.tumbler import Tumbler
 
 
 class BaseGame:
-    def __init__(self, screen: pygame.surface.Surface, lock: Lock):
+    def __init__(self, screen: pygame.surface.Surface, lock: Lock, fps: int = FPS):
         self.screen = screen
+        self.renderer = Renderer(screen)
         self.running = False
 
+        self.fps = fps
+        self.clock = pygame.time.Clock()
+        self.delta = 0.0
+        self.pending_events: List[pygame.event.Event] = []
+
         self.lock = lock
 
         self.mouse_pos = None
@@ -45,20 +52,37 @@ class BaseGame:
 
     def run(self):
         self.running = True
+        self.clock.tick()
         while self.running:
             self.frame()
+            self.delta = self.clock.tick(self.fps) / 1000
+            if self.running and self.is_idle():
+                self.wait_for_event()
 
     def frame(self):
         raise NotImplementedError("frame method must be implemented in child class")
 
+    def is_idle(self) -> bool:
+        return not self.animation_items and not self.current_animation_item
+
+    def wait_for_event(self):
+        self.pending_events.append(pygame.event.wait())
+        self.clock.tick()
+        self.delta = 0.0
+
     @staticmethod
     def init_pygame():
         pygame.init()
         pygame.display.set_caption("LockPicker")
         return pygame.display.set_mode((WIDTH, HEIGHT))
 
+    def get_events(self) -> List[pygame.event.Event]:
+        events = self.pending_events + pygame.event.get()
+        self.pending_events = []
+        return events
+
     def gather_events(self):
-        for event in pygame.event.get():
+        for event in self.get_events():
             if event.type == pygame.QUIT:
                 self.terminate()
             if event.type == pygame.KEYDOWN:
@@ -75,7 +99,7 @@ class BaseGame:
         self.mouse_was_pressed = self.mouse_pressed
 
     def draw_background(self):
-        self.screen.fill(BACKGROUND_COLOR)
+        self.renderer.clear()
 
     def draw_tumblers(self):
         self.highlighted = None
@@ -116,9 +140,7 @@ class BaseGame:
 
         color = HIGHLIGHT_COLOR if highlighted else TUMBLERS_COLORS[tumbler.group]
         rect = pygame.Rect(*self.get_tumbler_bounds(tumbler) if bounds is None else bounds)
-        surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-        surface.fill((*color, alpha))
-        self.screen.blit(surface, rect.topleft)
+        self.renderer.rectangle(rect, color, int(alpha))
 
     def draw_picks(self):
         for pick in range(self.lock.level.number_of_picks):
@@ -139,10 +161,18 @@ class BaseGame:
             x = position * (BAR_WIDTH + BAR_OFFSET) + X_OFFSET + BAR_WIDTH // 2
             y = h + PICK_OFFSET if upper else HEIGHT - h - PICK_OFFSET
 
+        x, y = int(x), int(y)
         color = (*PICK_COLORS[pick], alpha)
-        shape_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        diamond = pick == 0
+        key = ("pick", diamond, x, color)
+        self.renderer.sprite(key, lambda: self.create_pick_sprite(x, color, diamond), (0, y - PICK_SIZE))
+
+    @staticmethod
+    def create_pick_sprite(x: int, color: Tuple[int, int, int, int], diamond: bool) -> pygame.Surface:
+        shape_surface = pygame.Surface((x + PICK_SIZE + 1, 2 * PICK_SIZE + 1), pygame.SRCALPHA)
+        y = PICK_SIZE
 
-        if pick == 0:
+        if diamond:
             points = [
                 (x, y - PICK_SIZE),
                 (x - PICK_SIZE, y),
@@ -155,7 +185,7 @@ class BaseGame:
 
         rect = pygame.Rect(0, y - PICK_WIDTH // 2, x, PICK_WIDTH)
         pygame.draw.rect(shape_surface, color, rect)
-        self.screen.blit(shape_surface, (0, 0))
+        return shape_surface
 
     @staticmethod
     def get_tumbler_x(location: Location) -> int:
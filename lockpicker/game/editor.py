@@ -1,5 +1,4 @@
 import os
-from collections import deque
 from pathlib import Path
 from typing import Callable, Optional, Tuple, Union
 
@@ -11,11 +10,13 @@ from lockpicker.constants.gui import (
     ARROW_WIDTH,
     BAR_OFFSET,
     BAR_WIDTH,
+    FPS,
     HEIGHT,
     POST_RELEASE_COLOR,
     X_OFFSET,
 )
 from lockpicker.game.base import BaseGame
+from lockpicker.game.history import AddBinding, AddTumbler, History, RemoveTumbler, SetAttribute
 from lockpicker.lock import Lock
 from lockpicker.tumbler.base import BaseTumbler
 from lockpicker.tumbler.location import Location
@@ -24,13 +25,20 @@ from lockpicker.tumbler.tumbler import Tumbler
 
 class Editor(BaseGame):
     def __init__(
-        self, screen: pygame.surface.Surface, lock: Lock, path: Union[str, os.PathLike], run_game_callback: Callable
+        self,
+        screen: pygame.surface.Surface,
+        lock: Lock,
+        path: Union[str, os.PathLike],
+        run_game_callback: Callable,
+        fps: int = FPS,
     ):
-        super().__init__(screen, lock)
+        super().__init__(screen, lock, fps)
         self.path = Path(path)
 
         self.dragging_tumbler = None
         self.initial_height = None
+        self.initial_base_height = None
+        self.initial_post_release_height = None
 
         self.binding_initial = None
         self.binding_target = None
@@ -38,9 +46,7 @@ class Editor(BaseGame):
         self.run_game_callback = run_game_callback
         self.current_group = 0
 
-        self.undo_history = deque()
-        self.redo_history = deque()
-        self.save_state()
+        self.history = History(lock)
 
     def frame(self):
         self.gather_events()
@@ -55,31 +61,18 @@ class Editor(BaseGame):
         self.draw_transparent_tumbler()
         self.draw_bindings()
         self.draw_binding_arrow()
-        pygame.display.flip()
-
-    def save_state(self):
-        last_state = self.undo_history[-1] if self.undo_history else None
-        state = self.lock.level.serialize()
-        if last_state != state:
-            self.undo_history.append(state)
-            self.redo_history.clear()
+        self.renderer.update()
 
     def undo(self):
-        if self.undo_history:
-            self.reset_selections()
-            self.redo_history.append(self.lock.level.serialize())
-            state = self.undo_history.pop()
-            self.lock.level = self.lock.level.deserialize(state)
+        self.reset_selections()
+        self.history.undo()
 
     def redo(self):
-        if self.redo_history:
-            self.reset_selections()
-            self.undo_history.append(self.lock.level.serialize())
-            state = self.redo_history.pop()
-            self.lock.level = self.lock.level.deserialize(state)
+        self.reset_selections()
+        self.history.redo()
 
     def gather_events(self):
-        for event in pygame.event.get():
+        for event in self.get_events():
             if event.type == pygame.QUIT:
                 self.running = False
             if event.type == pygame.MOUSEBUTTONDOWN:
@@ -104,6 +97,7 @@ class Editor(BaseGame):
                         self.save_level()
                     if event.key == pygame.K_p:
                         self.run_game_callback()
+                        self.renderer.invalidate()
                         self.highlighted = None
                 if event.key == pygame.K_INSERT:
                     self.add_new_tumbler()
@@ -123,9 +117,7 @@ class Editor(BaseGame):
             if self.lock.get_tumbler(location) is None:
                 height = self.calculate_new_height(location)
                 tumbler = self.get_temp_tumbler(location, height)
-                self.lock.add_tumbler(tumbler)
-
-            self.save_state()
+                self.history.execute(AddTumbler(tumbler))
 
     def get_temp_tumbler(self, location: Location, height: int) -> Tumbler:
         base = BaseTumbler(location, self.current_group, height, self.lock.level.max_height)
@@ -134,25 +126,24 @@ class Editor(BaseGame):
     def delete_highlighted_tumbler(self):
         if self.highlighted is not None:
             tumbler = self.lock.get_tumbler(self.highlighted)
-            self.lock.remove_tumbler(tumbler)
+            self.history.execute(RemoveTumbler(tumbler))
             self.highlighted = None
-            self.save_state()
 
     def set_master_tumbler(self):
         if self.highlighted is not None:
             tumbler = self.lock.get_tumbler(self.highlighted)
             group_tumblers = self.lock.get_tumblers_by_group()[tumbler.group]
-            for location in group_tumblers:
-                tumb = self.lock.get_tumbler(location)
-                tumb.master = False
-
-            tumbler.master = True
-            self.save_state()
+            commands = [
+                SetAttribute(location, "master", location == tumbler.location)
+                for location in group_tumblers
+                if self.lock.get_tumbler(location).master != (location == tumbler.location)
+            ]
+            self.history.execute(*commands)
 
     def change_group(self, group: int):
         self.current_group = group
-        if self.highlighted is not None:
-            self.lock.get_tumbler(self.highlighted).group = group
+        if self.highlighted is not None and self.lock.get_tumbler(self.highlighted).group != group:
+            self.history.execute(SetAttribute(self.highlighted, "group", group))
 
     def handle_binding_key(self):
         if self.binding_initial is None:
@@ -173,9 +164,9 @@ class Editor(BaseGame):
     def complete_binding(self):
         if self.binding_initial is not None and self.binding_target is not None:
             difference = self.calculate_difference(self.binding_target)
-            self.lock.add_binding(self.binding_initial, self.binding_target, difference)
+            if difference != 0:
+                self.history.execute(AddBinding(self.binding_initial, self.binding_target, difference))
             self.cancel_binding()
-            self.save_state()
 
     def cancel_binding(self):
         self.binding_initial = None
@@ -188,26 +179,50 @@ class Editor(BaseGame):
 
         if self.mouse_pressed[0]:
             if self.dragging_tumbler is None and self.highlighted is not None:
-                self.dragging_tumbler = self.highlighted
+                self.start_dragging()
             if self.dragging_tumbler is not None:
                 tumbler = self.lock.get_tumbler(self.dragging_tumbler)
                 new_height = self.calculate_new_height(self.dragging_tumbler)
                 tumbler.height = new_height
         elif self.mouse_pressed[2]:
             if self.dragging_tumbler is None and self.highlighted is not None:
-                self.dragging_tumbler = self.highlighted
-                tumbler = self.lock.get_tumbler(self.dragging_tumbler)
-                self.initial_height = tumbler.height
+                self.start_dragging()
             if self.dragging_tumbler is not None:
                 tumbler = self.lock.get_tumbler(self.dragging_tumbler)
                 new_height = self.calculate_new_height(self.dragging_tumbler, limit=False)
                 tumbler.post_release_height = new_height - self.initial_height
         else:
             if self.dragging_tumbler is not None:
-                self.save_state()
+                self.record_dragging()
 
             self.dragging_tumbler = None
             self.initial_height = None
+            self.initial_base_height = None
+            self.initial_post_release_height = None
+
+    def start_dragging(self):
+        self.dragging_tumbler = self.highlighted
+        tumbler = self.lock.get_tumbler(self.dragging_tumbler)
+        self.initial_height = tumbler.height
+        self.initial_base_height = tumbler.base_height
+        self.initial_post_release_height = tumbler.post_release_height
+
+    def record_dragging(self):
+        tumbler = self.lock.get_tumbler(self.dragging_tumbler)
+        commands = []
+        if tumbler.base_height != self.initial_base_height:
+            commands.append(SetAttribute(tumbler.location, "height", tumbler.base_height, self.initial_base_height))
+        if tumbler.post_release_height != self.initial_post_release_height:
+            commands.append(
+                SetAttribute(
+                    tumbler.location,
+                    "post_release_height",
+                    tumbler.post_release_height,
+                    self.initial_post_release_height,
+                )
+            )
+
+        self.history.record(*commands)
 
     def draw_tumblers(self):
         self.highlighted = None
@@ -264,9 +279,7 @@ class Editor(BaseGame):
             else:
                 post_release_rect = pygame.Rect(x, y + p, BAR_WIDTH, -p)
 
-            post_release_surface = pygame.Surface((post_release_rect.width, post_release_rect.height), pygame.SRCALPHA)
-            post_release_surface.fill((*POST_RELEASE_COLOR, alpha))
-            self.screen.blit(post_release_surface, post_release_rect.topleft)
+            self.renderer.rectangle(post_release_rect, POST_RELEASE_COLOR, alpha)
 
     def draw_bindings(self):
         for start_location, targets in self.lock.level.bindings.items():
@@ -309,12 +322,29 @@ class Editor(BaseGame):
         if start_x == end_x and start_y == intermediate_y:
             return
 
+        start_x, start_y, intermediate_y, end_x, end_y = map(int, (start_x, start_y, intermediate_y, end_x, end_y))
+        left = min(start_x, end_x - ARROW_SIZE) - ARROW_WIDTH
+        top = min(start_y, intermediate_y, end_y) - ARROW_WIDTH
+        right = max(start_x, end_x + ARROW_SIZE) + ARROW_WIDTH
+        bottom = max(start_y, intermediate_y, end_y) + ARROW_WIDTH
+
         color = (*ARROW_COLOR, alpha)
-        surface = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+        points = (start_x - left, start_y - top, intermediate_y - top, end_x - left, end_y - top)
+        key = ("arrow", right - left, bottom - top, points, color)
+        self.renderer.sprite(
+            key, lambda: self.create_arrow_sprite((right - left, bottom - top), points, color), (left, top)
+        )
+
+    @staticmethod
+    def create_arrow_sprite(
+        size: Tuple[int, int], points: Tuple[int, int, int, int, int], color: Tuple[int, int, int, int]
+    ) -> pygame.Surface:
+        start_x, start_y, intermediate_y, end_x, end_y = points
+        surface = pygame.Surface(size, pygame.SRCALPHA)
         pygame.draw.line(surface, color, (start_x, start_y), (end_x, intermediate_y), ARROW_WIDTH)
         pygame.draw.line(surface, color, (end_x, intermediate_y), (end_x, end_y), ARROW_WIDTH)
         pygame.draw.line(surface, color, (end_x - ARROW_SIZE, end_y), (end_x + ARROW_SIZE, end_y), ARROW_WIDTH)
-        self.screen.blit(surface, (0, 0))
+        return surface
 
     def calculate_difference(self, location: Location) -> int:
         tumbler = self.lock.get_tumbler(location)
@@ -348,6 +378,8 @@ class Editor(BaseGame):
         self.binding_target = None
         self.dragging_tumbler = None
         self.initial_height = None
+        self.initial_base_height = None
+        self.initial_post_release_height = None
 
     def save_level(self):
         self.lock.level.save(self.path)
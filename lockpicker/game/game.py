@@ -1,16 +1,27 @@
+from typing import List, Optional
+
 import pygame
 
-from lockpicker.constants.gui import ANIMATION_SPEED
+from lockpicker.constants.gui import ANIMATION_SPEED, FPS
 from lockpicker.game.base import BaseGame
 from lockpicker.lock import Lock
+from lockpicker.solver.solution import Move
 
 
 class Game(BaseGame):
-    def __init__(self, screen: pygame.surface.Surface, lock: Lock, random_moves: bool = False):
-        super().__init__(screen, lock)
+    def __init__(
+        self,
+        screen: pygame.surface.Surface,
+        lock: Lock,
+        random_moves: bool = False,
+        moves: Optional[List[Move]] = None,
+        fps: int = FPS,
+    ):
+        super().__init__(screen, lock, fps)
         self.win = False
         self.loss = False
         self.random_moves = random_moves
+        self.moves = list(reversed(moves)) if moves is not None else []
 
     def frame(self):
         self.gather_events()
@@ -24,19 +35,21 @@ class Game(BaseGame):
         self.draw_background()
         self.draw_tumblers()
         self.draw_picks()
-        pygame.display.flip()
+        self.renderer.update()
 
     def action(self):
         self.toggle_current_pick()
         if not self.animation_frame():
             self.handle_selected_tumbler()
-            if self.random_moves:
+            if self.moves:
+                self.play_next_move()
+            elif self.random_moves:
                 self.lock.play_random_move()
             self.animation_items = self.lock.get_recent_changes()
 
     def animation_frame(self) -> bool:
         if self.animation_items or self.current_animation_item:
-            self.animation += ANIMATION_SPEED
+            self.animation += ANIMATION_SPEED * self.delta
             if self.current_animation_item and self.animation >= self.get_max_animation_value():
                 self.current_animation_item = {}
 
@@ -48,6 +61,14 @@ class Game(BaseGame):
 
         return False
 
+    def is_idle(self) -> bool:
+        return super().is_idle() and not self.moves and not self.random_moves
+
+    def play_next_move(self):
+        pick, location = self.moves.pop()
+        self.lock.select_pick(pick)
+        self.lock.push(location)
+
     def get_max_animation_value(self) -> int:
         return max(abs(end - start) for start, end in self.current_animation_item.values())
 
@@ -0,0 +1,133 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from lockpicker.constants.editor import HISTORY_LIMIT
+from lockpicker.lock import Lock
+from lockpicker.tumbler.location import Location
+from lockpicker.tumbler.tumbler import Tumbler
+
+BASE_ATTRIBUTES = {"height": "base_height"}
+
+
+class Command:
+    def apply(self, lock: Lock):
+        raise NotImplementedError("apply method must be implemented in child class")
+
+    def revert(self, lock: Lock):
+        raise NotImplementedError("revert method must be implemented in child class")
+
+
+@dataclass
+class AddTumbler(Command):
+    tumbler: Tumbler
+
+    def apply(self, lock: Lock):
+        lock.add_tumbler(self.tumbler)
+
+    def revert(self, lock: Lock):
+        lock.remove_tumbler(self.tumbler)
+
+
+@dataclass
+class RemoveTumbler(Command):
+    tumbler: Tumbler
+    bindings: Optional[Dict[Location, Dict[Location, int]]] = None
+
+    def apply(self, lock: Lock):
+        self.bindings = lock.level.bindings
+        lock.remove_tumbler(self.tumbler)
+
+    def revert(self, lock: Lock):
+        lock.add_tumbler(self.tumbler)
+        for initial_location, bindings in self.bindings.items():
+            for target_location, difference in bindings.items():
+                lock.add_binding(initial_location, target_location, difference)
+
+
+@dataclass
+class AddBinding(Command):
+    initial_location: Location
+    target_location: Location
+    difference: int
+    previous: Optional[int] = None
+
+    def apply(self, lock: Lock):
+        self.previous = lock.level.bindings.get(self.initial_location, {}).get(self.target_location)
+        lock.add_binding(self.initial_location, self.target_location, self.difference)
+
+    def revert(self, lock: Lock):
+        bindings = lock.level.bindings
+        if self.previous is not None:
+            lock.add_binding(self.initial_location, self.target_location, self.previous)
+        else:
+            del bindings[self.initial_location][self.target_location]
+            if not bindings[self.initial_location]:
+                del bindings[self.initial_location]
+
+
+@dataclass
+class SetAttribute(Command):
+    location: Location
+    attribute: str
+    value: Any
+    previous: Any = None
+
+    def apply(self, lock: Lock):
+        tumbler = lock.get_tumbler(self.location)
+        self.previous = getattr(tumbler, BASE_ATTRIBUTES.get(self.attribute, self.attribute))
+        self._set(lock, self.value)
+
+    def revert(self, lock: Lock):
+        self._set(lock, self.previous)
+
+    def _set(self, lock: Lock, value: Any):
+        tumbler = lock.get_tumbler(self.location)
+        if self.attribute == "group":
+            lock.level.set_group(tumbler, value)
+        else:
+            setattr(tumbler, self.attribute, value)
+
+
+class History:
+    def __init__(self, lock: Lock, limit: Optional[int] = HISTORY_LIMIT):
+        self.lock = lock
+        self.undo_stack: Deque[Tuple[Command, ...]] = deque(maxlen=limit)
+        self.redo_stack: List[Tuple[Command, ...]] = []
+
+    def execute(self, *commands: Command):
+        for command in commands:
+            command.apply(self.lock)
+
+        self.record(*commands)
+
+    def record(self, *commands: Command):
+        if commands:
+            self.undo_stack.append(commands)
+            self.redo_stack.clear()
+
+    def undo(self) -> bool:
+        if not self.undo_stack:
+            return False
+
+        commands = self.undo_stack.pop()
+        for command in reversed(commands):
+            command.revert(self.lock)
+
+        self.redo_stack.append(commands)
+        return True
+
+    def redo(self) -> bool:
+        if not self.redo_stack:
+            return False
+
+        commands = self.redo_stack.pop()
+        for command in commands:
+            command.apply(self.lock)
+
+        self.undo_stack.append(commands)
+        return True
+
+    def clear(self):
+        self.undo_stack.clear()
+        self.redo_stack.clear()
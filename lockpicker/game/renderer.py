@@ -0,0 +1,122 @@
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Optional, Set, Tuple
+
+import pygame
+
+from lockpicker.constants.gui import BACKGROUND_COLOR, MAX_DIRTY_RECTS, SPRITE_CACHE_SIZE
+
+Color = Tuple[int, int, int]
+Item = Tuple[Hashable, Tuple[int, int]]
+
+
+class SpriteCache:
+    def __init__(self, capacity: int = SPRITE_CACHE_SIZE):
+        if capacity < 1:
+            raise ValueError(f"Capacity must be at least 1, got {capacity}")
+
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._sprites: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def get(self, key: Hashable, create: Callable[[], pygame.Surface]) -> pygame.Surface:
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self._sprites.move_to_end(key)
+            return sprite
+
+        self.misses += 1
+        sprite = create()
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.capacity:
+            self._sprites.popitem(last=False)
+
+        return sprite
+
+    def rectangle(self, size: Tuple[int, int], color: Color, alpha: int) -> pygame.Surface:
+        return self.get((size, color, alpha), lambda: self._create_rectangle(size, color, alpha))
+
+    def clear(self):
+        self._sprites.clear()
+
+    @staticmethod
+    def _create_rectangle(size: Tuple[int, int], color: Color, alpha: int) -> pygame.Surface:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill((*color, alpha))
+        return surface
+
+
+class Renderer:
+    def __init__(self, screen: pygame.surface.Surface, cache: Optional[SpriteCache] = None):
+        self.screen = screen
+        self.cache = SpriteCache() if cache is None else cache
+        self.background = BACKGROUND_COLOR
+
+        self._items: List[Item] = []
+        self._sprites: List[pygame.Surface] = []
+        self._previous: Optional[Set[Item]] = None
+        self._previous_items: List[Item] = []
+        self._previous_rects: List[pygame.Rect] = []
+
+    def clear(self):
+        self._items = []
+        self._sprites = []
+
+    def blit(self, key: Hashable, sprite: pygame.Surface, position: Tuple[float, float]):
+        self._items.append((key, (int(position[0]), int(position[1]))))
+        self._sprites.append(sprite)
+
+    def rectangle(self, rect: pygame.Rect, color: Color, alpha: int):
+        if rect.width > 0 and rect.height > 0:
+            key = (rect.size, color, alpha)
+            self.blit(key, self.cache.rectangle(rect.size, color, alpha), rect.topleft)
+
+    def sprite(self, key: Hashable, create: Callable[[], pygame.Surface], position: Tuple[float, float]):
+        self.blit(key, self.cache.get(key, create), position)
+
+    def update(self) -> List[pygame.Rect]:
+        rects = [sprite.get_rect(topleft=position) for sprite, (_, position) in zip(self._sprites, self._items)]
+        dirty_rects = self._get_dirty_rects(rects)
+        for dirty_rect in dirty_rects:
+            self._redraw(dirty_rect, rects)
+
+        self._previous = set(self._items)
+        self._previous_items = self._items
+        self._previous_rects = rects
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+
+        return dirty_rects
+
+    def invalidate(self):
+        self._previous = None
+
+    def _get_dirty_rects(self, rects: List[pygame.Rect]) -> List[pygame.Rect]:
+        screen_rect = self.screen.get_rect()
+        if self._previous is None:
+            return [screen_rect]
+
+        current = set(self._items)
+        dirty_rects = [rect for rect, item in zip(rects, self._items) if item not in self._previous]
+        dirty_rects.extend(
+            rect for rect, item in zip(self._previous_rects, self._previous_items) if item not in current
+        )
+        dirty_rects = [rect.clip(screen_rect) for rect in dirty_rects]
+        dirty_rects = [rect for rect in dirty_rects if rect.width > 0 and rect.height > 0]
+        if len(dirty_rects) > MAX_DIRTY_RECTS:
+            return [dirty_rects[0].unionall(dirty_rects[1:])]
+
+        return dirty_rects
+
+    def _redraw(self, dirty_rect: pygame.Rect, rects: List[pygame.Rect]):
+        self.screen.set_clip(dirty_rect)
+        self.screen.fill(self.background)
+        for sprite, rect in zip(self._sprites, rects):
+            if dirty_rect.colliderect(rect):
+                self.screen.blit(sprite, rect)
+
+        self.screen.set_clip(None)
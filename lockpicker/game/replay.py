@@ -0,0 +1,132 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
+
+import pygame
+
+from lockpicker.array_lock import ArrayLock
+from lockpicker.constants.gui import FPS, HEIGHT, MAX_REPLAY_FRAMES, WIDTH
+from lockpicker.game.game import Game
+from lockpicker.level.level import Level
+from lockpicker.lock import Lock
+from lockpicker.solver import MAX_STATES
+from lockpicker.solver.solution import Move
+from lockpicker.solver.solve import solve
+
+FRAME_FORMATS = ["png", "rgb"]
+
+
+class ReplayGame(Game):
+    def __init__(self, screen: pygame.surface.Surface, lock: Lock, moves: List[Move], fps: int = FPS):
+        super().__init__(screen, lock, moves=moves, fps=fps)
+        self.delta = 1 / fps
+
+    def get_mouse_state(self):
+        self.mouse_pos = (-1, -1)
+        self.mouse_pressed = (False, False, False)
+
+    def frames(self, max_frames: int = MAX_REPLAY_FRAMES) -> Iterable[pygame.surface.Surface]:
+        for _ in range(max_frames):
+            self.frame()
+            yield self.screen
+            if self.is_idle():
+                break
+
+
+@contextmanager
+def headless_display() -> Iterator[None]:
+    previous = os.environ.get("SDL_VIDEODRIVER")
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    try:
+        pygame.display.init()
+        try:
+            yield
+        finally:
+            pygame.display.quit()
+    finally:
+        if previous is None:
+            del os.environ["SDL_VIDEODRIVER"]
+        else:
+            os.environ["SDL_VIDEODRIVER"] = previous
+
+
+def render_replay(
+    level: Level,
+    moves: List[Move],
+    output: Path,
+    frame_format: str = "png",
+    fps: int = FPS,
+    max_frames: int = MAX_REPLAY_FRAMES,
+) -> int:
+    if frame_format not in FRAME_FORMATS:
+        raise ValueError(f"Unknown frame format: {frame_format}")
+    if fps < 1:
+        raise ValueError(f"Replay frame rate must be at least 1, got {fps}")
+
+    with headless_display():
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        game = ReplayGame(screen, Lock(level.copy()), moves, fps)
+        if frame_format == "png":
+            output.mkdir(parents=True, exist_ok=True)
+            return _write_png_frames(game.frames(max_frames), output)
+
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, "wb") as file:
+            return _write_raw_frames(game.frames(max_frames), file)
+
+
+def render_level(
+    path: Path,
+    output_directory: Path,
+    frame_format: str = "png",
+    fps: int = FPS,
+    solver: str = "bfs",
+    heuristic: str = "unsolved",
+    max_states: int = MAX_STATES,
+) -> Tuple[str, Optional[int]]:
+    level = Level.load(path)
+    solution = solve(ArrayLock(level), solver, heuristic, max_states=max_states)
+    if not solution.solvable:
+        return str(path), None
+
+    output = output_directory / (path.stem if frame_format == "png" else f"{path.stem}.rgb")
+    return str(path), render_replay(level, solution.moves, output, frame_format, fps)
+
+
+def render_levels(
+    paths: Iterable[Path],
+    output_directory: Path,
+    frame_format: str = "png",
+    fps: int = FPS,
+    solver: str = "bfs",
+    heuristic: str = "unsolved",
+    max_states: int = MAX_STATES,
+    workers: Optional[int] = None,
+) -> List[Tuple[str, Optional[int]]]:
+    paths = list(paths)
+    workers = min(workers or os.cpu_count() or 1, max(len(paths), 1))
+    arguments = (output_directory, frame_format, fps, solver, heuristic, max_states)
+    if workers == 1:
+        return [render_level(path, *arguments) for path in paths]
+
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(render_level, path, *arguments) for path in paths]
+        return [future.result() for future in futures]
+
+
+def _write_png_frames(frames: Iterable[pygame.surface.Surface], directory: Path) -> int:
+    count = 0
+    for count, frame in enumerate(frames, 1):
+        pygame.image.save(frame, str(directory / f"frame_{count:05d}.png"))
+
+    return count
+
+
+def _write_raw_frames(frames: Iterable[pygame.surface.Surface], file: BinaryIO) -> int:
+    count = 0
+    for count, frame in enumerate(frames, 1):
+        file.write(pygame.image.tobytes(frame, "RGB"))
+
+    return count
@@ -0,0 +1,126 @@
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Union
+
+from lockpicker.array_lock import ArrayLock
+from lockpicker.lock import Lock
+
+HOOKS = {
+    Lock: {
+        "push": "push",
+        "bindings": "_apply_bindings",
+        "revise_picks": "_revise_picks",
+        "state_appends": "_add_current_state",
+        "possible_moves": "_find_possible_moves",
+    },
+    ArrayLock: {
+        "push": "push",
+        "bindings": "_apply_bindings",
+        "revise_picks": "_revise_picks",
+        "possible_moves": "get_possible_moves",
+    },
+}
+
+
+def find_hooks(lock_class: type) -> Dict[str, str]:
+    for cls in lock_class.__mro__:
+        if cls in HOOKS:
+            return HOOKS[cls]
+
+    raise TypeError(f"No profiling hooks for {lock_class.__name__}")
+
+
+@dataclass
+class CallStats:
+    calls: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.elapsed / self.calls if self.calls else 0.0
+
+
+class LockProfiler:
+    def __init__(
+        self,
+        lock: Union[Lock, ArrayLock],
+        callback: Optional[Callable[[str, float], None]] = None,
+        per_move: bool = False,
+    ):
+        self.lock = lock
+        self.callback = callback
+        self.per_move = per_move
+        self.hooks = find_hooks(type(lock))
+        self.stats = {name: CallStats() for name in self.hooks}
+        self.moves: List[Dict[str, CallStats]] = []
+
+    def __enter__(self) -> "LockProfiler":
+        self.attach()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.detach()
+
+    def attach(self):
+        for name, method in self.hooks.items():
+            wrapper = self._wrap(name, getattr(self.lock, method))
+            if name == "push" and self.per_move:
+                wrapper = self._wrap_move(wrapper)
+            setattr(self.lock, method, wrapper)
+
+    def detach(self):
+        for method in self.hooks.values():
+            self.lock.__dict__.pop(method, None)
+
+    def reset(self):
+        for stats in self.stats.values():
+            stats.calls = 0
+            stats.elapsed = 0.0
+        self.moves.clear()
+
+    def snapshot(self) -> Dict[str, CallStats]:
+        return {name: CallStats(stats.calls, stats.elapsed) for name, stats in self.stats.items()}
+
+    def _wrap(self, name: str, method: Callable) -> Callable:
+        stats = self.stats[name]
+        callback = self.callback
+        counter = time.perf_counter
+
+        def wrapper(*args, **kwargs):
+            start = counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = counter() - start
+                stats.calls += 1
+                stats.elapsed += elapsed
+                if callback is not None:
+                    callback(name, elapsed)
+
+        return wrapper
+
+    def _wrap_move(self, method: Callable) -> Callable:
+        def wrapper(*args, **kwargs):
+            before = self.snapshot()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.moves.append(
+                    {
+                        name: CallStats(stats.calls - before[name].calls, stats.elapsed - before[name].elapsed)
+                        for name, stats in self.stats.items()
+                    }
+                )
+
+        return wrapper
+
+
+def format_stats(stats: Dict[str, CallStats], moves: int) -> str:
+    lines = [f"{'hook':<16}{'calls':>10}{'total ms':>12}{'per call us':>14}{'per move us':>14}"]
+    for name, entry in stats.items():
+        per_move = entry.elapsed / moves * 1e6 if moves else 0.0
+        lines.append(
+            f"{name:<16}{entry.calls:>10}{entry.elapsed * 1e3:>12.3f}{entry.mean * 1e6:>14.2f}{per_move:>14.2f}"
+        )
+
+    return "\n".join(lines)
@@ -1,2 +1,26 @@
 MAX_HEIGHT = 11
 NUMBER_OF_PICKS = 2
+
+LEVEL_MAGIC = b"LKLV"
+LEVEL_VERSION = 2
+LEVEL_HEADER_FORMAT = "<4sHHIIIIII"
+GZIP_MAGIC = b"\x1f\x8b"
+
+COUNT_FORMAT = "I"
+BINDING_HEADER_FORMAT = "=I?I"
+BINDING_FORMAT = "I?i"
+
+PACK_MAGIC = b"LKPK"
+PACK_VERSION = 1
+PACK_HEADER_FORMAT = "<4sHI"
+PACK_INDEX_FORMAT = "<64sQIIII"
+PACK_TUMBLER_FORMAT = "<i?iii?"
+PACK_BINDING_FORMAT = "<i?i?i"
+
+POSITIONS = 4
+DENSITY = 0.75
+BINDINGS = 4
+MAX_BINDING_DIFFERENCE = 3
+MAX_POST_RELEASE_HEIGHT = 3
+CANDIDATE_STATES = 100_000
+CANDIDATES_PER_TASK = 16
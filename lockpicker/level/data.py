@@ -1,4 +1,4 @@
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 
 
 class LevelData(NamedTuple):
@@ -6,3 +6,13 @@ class LevelData(NamedTuple):
     max_height: bytes
     serialized_tumblers: bytes
     serialized_bindings: bytes
+
+
+class LevelHeader(NamedTuple):
+    version: int
+    number_of_picks: int
+    max_height: int
+    tumblers_block_size: int
+    bindings_block_size: int
+    compressed_size: int
+    checksum: Optional[int] = None
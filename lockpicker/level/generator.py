@@ -0,0 +1,193 @@
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from lockpicker.array_lock import ArrayLock
+from lockpicker.level import (
+    BINDINGS,
+    CANDIDATE_STATES,
+    CANDIDATES_PER_TASK,
+    DENSITY,
+    MAX_BINDING_DIFFERENCE,
+    MAX_HEIGHT,
+    MAX_POST_RELEASE_HEIGHT,
+    NUMBER_OF_PICKS,
+    POSITIONS,
+)
+from lockpicker.level.data import LevelData
+from lockpicker.level.level import Level
+from lockpicker.solver import bfs
+from lockpicker.solver.solution import Solution
+from lockpicker.solver.successors import canonical_snapshot, expand
+from lockpicker.tumbler.base import BaseTumbler
+from lockpicker.tumbler.location import Location
+from lockpicker.tumbler.tumbler import Tumbler
+
+
+@dataclass(frozen=True)
+class GeneratorSettings:
+    positions: int = POSITIONS
+    groups: int = 1
+    number_of_picks: int = NUMBER_OF_PICKS
+    max_height: int = MAX_HEIGHT
+    density: float = DENSITY
+    bindings: int = BINDINGS
+    max_binding_difference: int = MAX_BINDING_DIFFERENCE
+    max_post_release_height: int = MAX_POST_RELEASE_HEIGHT
+    min_length: int = 1
+    max_length: int = 100
+    min_branching: float = 0.0
+    max_branching: float = math.inf
+    max_states: int = CANDIDATE_STATES
+
+    def __post_init__(self):
+        if self.positions < 1:
+            raise ValueError(f"Number of positions must be at least 1, got {self.positions}")
+        if self.groups < 1:
+            raise ValueError(f"Number of groups must be at least 1, got {self.groups}")
+        if self.max_height < 3:
+            raise ValueError(f"Maximum height must be at least 3, got {self.max_height}")
+        if not 0.0 < self.density <= 1.0:
+            raise ValueError(f"Density must be in (0, 1], got {self.density}")
+        if self.min_length > self.max_length or self.min_branching > self.max_branching:
+            raise ValueError("Requested difficulty band is empty")
+
+    def accepts(self, length: int, branching: float) -> bool:
+        return self.min_length <= length <= self.max_length and self.min_branching <= branching <= self.max_branching
+
+
+@dataclass
+class GeneratedLevel:
+    level: Level
+    seed: int
+    length: int
+    branching: float
+
+
+def sample_level(settings: GeneratorSettings, rng: random.Random) -> Level:
+    locations = [
+        Location(position, upper)
+        for position in range(settings.positions)
+        for upper in (True, False)
+        if rng.random() < settings.density
+    ]
+    if not locations:
+        locations = [Location(rng.randrange(settings.positions), rng.random() < 0.5)]
+
+    groups = [rng.randrange(settings.groups) for _ in locations]
+    numbering = {group: index for index, group in enumerate(dict.fromkeys(groups))}
+    groups = [numbering[group] for group in groups]
+
+    masters = {}
+    for location, group in sorted(zip(locations, groups), key=lambda item: (item[0].position, rng.random())):
+        masters[group] = location
+
+    tumblers = {}
+    for location, group in zip(locations, groups):
+        post_release_height = 0
+        if rng.random() < 0.5:
+            post_release_height = rng.randint(-settings.max_post_release_height, settings.max_post_release_height)
+
+        counter = tumblers.get(location.counter)
+        max_height = settings.max_height - (counter.base_height if counter is not None else 0)
+        base = BaseTumbler(
+            location,
+            group,
+            rng.randrange(1, max(max_height, 2)),
+            settings.max_height,
+            post_release_height,
+            masters[group] == location,
+        )
+        tumblers[location] = Tumbler(base)
+
+    level = Level(settings.number_of_picks, settings.max_height, tumblers, {})
+    if len(locations) > 1:
+        for _ in range(settings.bindings):
+            initial_location, target_location = rng.sample(locations, 2)
+            difference = rng.randint(1, settings.max_binding_difference) * rng.choice((-1, 1))
+            level.add_binding(initial_location, target_location, difference)
+
+    return level
+
+
+def measure_branching(lock: ArrayLock, solution: Solution) -> float:
+    initial_state = lock.snapshot()
+    try:
+        state = canonical_snapshot(lock)
+        branching = []
+        for move in solution.moves:
+            children = {child for _, child in expand(lock, state)}
+            children.discard(state)
+            branching.append(len(children))
+
+            lock.restore(state)
+            lock.select_pick(move[0])
+            lock.push(move[1])
+            state = canonical_snapshot(lock)
+
+        return sum(branching) / len(branching) if branching else 0.0
+    finally:
+        lock.restore(initial_state)
+
+
+def evaluate_level(level: Level, settings: GeneratorSettings) -> Optional[Tuple[int, float]]:
+    lock = ArrayLock(level.copy())
+    solution = bfs.solve(lock, max_states=settings.max_states)
+    if not solution.solvable:
+        return None
+
+    branching = measure_branching(lock, solution)
+    if not settings.accepts(solution.length, branching):
+        return None
+
+    return solution.length, branching
+
+
+def generate_candidates(settings: GeneratorSettings, seeds: List[int]) -> List[GeneratedLevel]:
+    levels = []
+    for seed in seeds:
+        level = sample_level(settings, random.Random(seed))
+        metrics = evaluate_level(level, settings)
+        if metrics is not None:
+            levels.append(GeneratedLevel(level, seed, *metrics))
+
+    return levels
+
+
+def generate_levels(
+    count: int,
+    settings: GeneratorSettings = GeneratorSettings(),
+    max_candidates: Optional[int] = None,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> List[GeneratedLevel]:
+    max_candidates = count * 1000 if max_candidates is None else max_candidates
+    workers = workers or os.cpu_count() or 1
+    rng = random.Random(seed)
+    tasks = [
+        min(CANDIDATES_PER_TASK, max_candidates - start) for start in range(0, max_candidates, CANDIDATES_PER_TASK)
+    ]
+
+    levels: Dict[LevelData, GeneratedLevel] = {}
+    executor = ProcessPoolExecutor(workers) if workers > 1 else None
+    try:
+        for wave in range(0, len(tasks), workers):
+            seeds = [rng.sample(range(2**32), size) for size in tasks[wave : wave + workers]]
+            if executor is None:
+                results = [generate_candidates(settings, task_seeds) for task_seeds in seeds]
+            else:
+                results = executor.map(generate_candidates, [settings] * len(seeds), seeds)
+
+            for generated in (generated for result in results for generated in result):
+                levels.setdefault(generated.level.serialize(), generated)
+
+            if len(levels) >= count:
+                break
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    return list(levels.values())[:count]
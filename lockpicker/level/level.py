@@ -2,16 +2,32 @@ import gzip
 import os
 import struct
 import warnings
+import zlib
 from collections import defaultdict
 from dataclasses import dataclass
 from typing import DefaultDict, Dict, List, Optional, Tuple, Union
 
-from lockpicker.level import MAX_HEIGHT, NUMBER_OF_PICKS
-from lockpicker.level.data import LevelData
-from lockpicker.tumbler import STRUCT_FORMAT
+from lockpicker.level import (
+    BINDING_FORMAT,
+    BINDING_HEADER_FORMAT,
+    COUNT_FORMAT,
+    GZIP_MAGIC,
+    LEVEL_HEADER_FORMAT,
+    LEVEL_MAGIC,
+    LEVEL_VERSION,
+    MAX_HEIGHT,
+    NUMBER_OF_PICKS,
+)
+from lockpicker.level.data import LevelData, LevelHeader
+from lockpicker.tumbler.base import TUMBLER_STRUCT, BaseTumbler
 from lockpicker.tumbler.location import Location
 from lockpicker.tumbler.tumbler import Tumbler
 
+HEADER_STRUCT = struct.Struct(LEVEL_HEADER_FORMAT)
+COUNT_STRUCT = struct.Struct(COUNT_FORMAT)
+BINDING_HEADER_STRUCT = struct.Struct(BINDING_HEADER_FORMAT)
+BINDING_STRUCT = struct.Struct(BINDING_FORMAT)
+
 
 @dataclass
 class Level:
@@ -66,6 +82,14 @@ class Level:
     def add_tumbler(self, tumbler: Tumbler):
         self.tumblers[tumbler.location] = tumbler
         self.groups[tumbler.group].append(tumbler.location)
+        counter = self.tumblers.get(tumbler.location.counter)
+        tumbler.counter = counter
+        if counter is not None:
+            counter.counter = tumbler
+
+    def set_group(self, tumbler: Tumbler, group: int):
+        tumbler.group = group
+        self.groups = self._create_groups()
 
     def remove_bindings(self, location: Location):
         bindings = {}
@@ -82,22 +106,39 @@ class Level:
         self.remove_bindings(location)
         self.tumblers.pop(location)
         self.groups[tumbler.group].remove(location)
+        if not self.groups[tumbler.group]:
+            del self.groups[tumbler.group]
+
+        counter = self.tumblers.get(location.counter)
+        if counter is not None:
+            counter.counter = None
         del tumbler
 
     def serialize_tumblers(self) -> bytes:
-        tumblers_count = struct.pack("I", len(self.tumblers))
-        tumblers_data = b"".join(tumbler.serialize() for tumbler in self.tumblers.values())
-        return tumblers_count + tumblers_data
+        buffer = bytearray(COUNT_STRUCT.size + len(self.tumblers) * TUMBLER_STRUCT.size)
+        COUNT_STRUCT.pack_into(buffer, 0, len(self.tumblers))
+        offset = COUNT_STRUCT.size
+        for tumbler in self.tumblers.values():
+            tumbler.base.serialize_into(buffer, offset)
+            offset += TUMBLER_STRUCT.size
+
+        return bytes(buffer)
 
     def serialize_bindings(self) -> bytes:
-        bindings_data = struct.pack("I", len(self.bindings))
-        for position, bindings in self.bindings.items():
-            bindings_data += struct.pack("I?", *position)
-            bindings_data += struct.pack("I", len(bindings))
+        size = COUNT_STRUCT.size + sum(
+            BINDING_HEADER_STRUCT.size + len(bindings) * BINDING_STRUCT.size for bindings in self.bindings.values()
+        )
+        buffer = bytearray(size)
+        COUNT_STRUCT.pack_into(buffer, 0, len(self.bindings))
+        offset = COUNT_STRUCT.size
+        for (position, upper), bindings in self.bindings.items():
+            BINDING_HEADER_STRUCT.pack_into(buffer, offset, position, upper, len(bindings))
+            offset += BINDING_HEADER_STRUCT.size
             for (p, u), d in bindings.items():
-                bindings_data += struct.pack("I?i", p, u, d)
+                BINDING_STRUCT.pack_into(buffer, offset, p, u, d)
+                offset += BINDING_STRUCT.size
 
-        return bindings_data
+        return bytes(buffer)
 
     def serialize(self) -> LevelData:
         number_of_picks = struct.pack("I", self.number_of_picks)
@@ -107,46 +148,49 @@ class Level:
         return LevelData(number_of_picks, max_height, serialized_tumblers, serialized_bindings)
 
     def save(self, filepath: Union[str, os.PathLike]):
-        with gzip.open(filepath, "wb") as file:
-            number_of_picks, max_height, serialized_tumblers, serialized_bindings = self.serialize()
-            tumblers_block_size = struct.pack("I", len(serialized_tumblers))
-            bindings_block_size = struct.pack("I", len(serialized_tumblers))
-            file.write(number_of_picks)
-            file.write(max_height)
-            file.write(tumblers_block_size)
-            file.write(serialized_tumblers)
-            file.write(bindings_block_size)
-            file.write(serialized_bindings)
+        number_of_picks, max_height, serialized_tumblers, serialized_bindings = self.serialize()
+        body = serialized_tumblers + serialized_bindings
+        compressed_body = zlib.compress(body)
+        header = HEADER_STRUCT.pack(
+            LEVEL_MAGIC,
+            LEVEL_VERSION,
+            0,
+            self.number_of_picks,
+            self.max_height,
+            len(serialized_tumblers),
+            len(serialized_bindings),
+            len(compressed_body),
+            zlib.crc32(body),
+        )
+        with open(filepath, "wb") as file:
+            file.write(header)
+            file.write(compressed_body)
             print(f"Level saved to {filepath}.")
 
     @staticmethod
     def deserialize_tumblers(data: bytes, max_height: int) -> Dict[Location, Tumbler]:
-        tumblers_count = struct.unpack("I", data[:4])[0]
+        view = memoryview(data)
+        tumblers_count = COUNT_STRUCT.unpack_from(view)[0]
+        records = view[COUNT_STRUCT.size : COUNT_STRUCT.size + tumblers_count * TUMBLER_STRUCT.size]
         tumblers = {}
-        size = struct.calcsize(STRUCT_FORMAT)
-        for i in range(tumblers_count):
-            tumbler_data = data[4 + i * size : 4 + (i + 1) * size]
-            tumbler = Tumbler.deserialize(tumbler_data, max_height)
+        for fields in TUMBLER_STRUCT.iter_unpack(records):
+            tumbler = Tumbler(BaseTumbler.from_fields(fields, max_height))
             tumblers[tumbler.location] = tumbler
 
         return tumblers
 
     @staticmethod
     def deserialize_bindings(data: bytes) -> Dict[Location, Dict[Location, int]]:
-        bindings_count = struct.unpack("I", data[:4])[0]
+        view = memoryview(data)
+        bindings_count = COUNT_STRUCT.unpack_from(view)[0]
         bindings = {}
-        offset = 4
-        for i in range(bindings_count):
-            location = struct.unpack("I?", data[offset : offset + 5])
-            offset += 5
-            binding_count = struct.unpack("I", data[offset : offset + 4])[0]
-            offset += 4
-            binding = {}
-            for _ in range(binding_count):
-                p, u, d = struct.unpack("I?i", data[offset : offset + 12])
-                offset += 12
-                binding[Location(p, u)] = d
-            bindings[Location(*location)] = binding
+        offset = COUNT_STRUCT.size
+        for _ in range(bindings_count):
+            position, upper, binding_count = BINDING_HEADER_STRUCT.unpack_from(view, offset)
+            offset += BINDING_HEADER_STRUCT.size
+            records = view[offset : offset + binding_count * BINDING_STRUCT.size]
+            offset += binding_count * BINDING_STRUCT.size
+            bindings[Location(position, upper)] = {Location(p, u): d for p, u, d in BINDING_STRUCT.iter_unpack(records)}
 
         return bindings
 
@@ -158,15 +202,75 @@ class Level:
         bindings = Level.deserialize_bindings(bindings_data)
         return Level(number_of_picks, max_height, tumblers, bindings)
 
+    @staticmethod
+    def read_header(filepath: Union[str, os.PathLike]) -> LevelHeader:
+        with open(filepath, "rb") as file:
+            data = file.read(HEADER_STRUCT.size)
+            if data.startswith(GZIP_MAGIC):
+                return Level._read_header_v1(filepath)
+
+            if len(data) < HEADER_STRUCT.size:
+                raise ValueError(f"{filepath} is too short to be a level file")
+
+            magic, version, _, *fields = HEADER_STRUCT.unpack(data)
+            if magic != LEVEL_MAGIC:
+                raise ValueError(f"{filepath} is not a level file")
+            if version != LEVEL_VERSION:
+                raise ValueError(f"{filepath} has an unsupported level format version {version}")
+
+            header = LevelHeader(version, *fields)
+            file_size = os.fstat(file.fileno()).st_size
+            if file_size != HEADER_STRUCT.size + header.compressed_size:
+                raise ValueError(f"{filepath} is truncated or has trailing data")
+
+            return header
+
     @staticmethod
     def load(filepath: Union[str, os.PathLike]) -> "Level":
+        header = Level.read_header(filepath)
+        if header.version == 1:
+            return Level._load_v1(filepath)
+
+        with open(filepath, "rb") as file:
+            file.seek(HEADER_STRUCT.size)
+            try:
+                body = zlib.decompress(file.read(header.compressed_size))
+            except zlib.error as error:
+                raise ValueError(f"{filepath} has a corrupted body: {error}")
+
+        if len(body) != header.tumblers_block_size + header.bindings_block_size:
+            raise ValueError(f"{filepath} has inconsistent block sizes")
+        if zlib.crc32(body) != header.checksum:
+            raise ValueError(f"{filepath} has an invalid checksum")
+
+        view = memoryview(body)
+        tumblers = Level.deserialize_tumblers(view[: header.tumblers_block_size], header.max_height)
+        bindings = Level.deserialize_bindings(view[header.tumblers_block_size :])
+        return Level(header.number_of_picks, header.max_height, tumblers, bindings)
+
+    @staticmethod
+    def _read_header_v1(filepath: Union[str, os.PathLike]) -> LevelHeader:
+        try:
+            with gzip.open(filepath, "rb") as file:
+                number_of_picks, max_height, tumblers_block_size = struct.unpack("III", file.read(12))
+                file.seek(tumblers_block_size + 4, os.SEEK_CUR)
+                bindings_block_size = len(file.read())
+        except (EOFError, OSError, struct.error) as error:
+            raise ValueError(f"{filepath} is not a valid v1 level file: {error}")
+
+        return LevelHeader(
+            1, number_of_picks, max_height, tumblers_block_size, bindings_block_size, os.path.getsize(filepath)
+        )
+
+    @staticmethod
+    def _load_v1(filepath: Union[str, os.PathLike]) -> "Level":
         with gzip.open(filepath, "rb") as file:
             number_of_picks_data = file.read(4)
             max_height_data = file.read(4)
             tumblers_block_size = struct.unpack("I", file.read(4))[0]
             tumblers_data = file.read(tumblers_block_size)
-            bindings_block_size = struct.unpack("I", file.read(4))[0]
-            bindings_data = file.read(bindings_block_size)
+            file.read(4)
+            bindings_data = file.read()
 
             number_of_picks = struct.unpack("I", number_of_picks_data)[0]
             max_height = struct.unpack("I", max_height_data)[0]
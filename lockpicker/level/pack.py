@@ -0,0 +1,202 @@
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, NamedTuple, Union
+
+from lockpicker.level import (
+    PACK_BINDING_FORMAT,
+    PACK_HEADER_FORMAT,
+    PACK_INDEX_FORMAT,
+    PACK_MAGIC,
+    PACK_TUMBLER_FORMAT,
+    PACK_VERSION,
+)
+from lockpicker.level.level import Level
+from lockpicker.tumbler.base import BaseTumbler
+from lockpicker.tumbler.location import Location
+from lockpicker.tumbler.tumbler import Tumbler
+
+HEADER_SIZE = struct.calcsize(PACK_HEADER_FORMAT)
+INDEX_SIZE = struct.calcsize(PACK_INDEX_FORMAT)
+TUMBLER_SIZE = struct.calcsize(PACK_TUMBLER_FORMAT)
+BINDING_SIZE = struct.calcsize(PACK_BINDING_FORMAT)
+NAME_SIZE = INDEX_SIZE - struct.calcsize("<QIIII")
+
+
+class PackEntry(NamedTuple):
+    name: str
+    offset: int
+    number_of_picks: int
+    max_height: int
+    tumblers: int
+    bindings: int
+
+
+class LevelPack:
+    def __init__(self, path: Union[str, os.PathLike]):
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is not a level pack")
+
+        self._view = memoryview(self._mmap)
+        self._entries = self._read_index(path)
+
+    def __enter__(self) -> "LevelPack":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __getitem__(self, name: str) -> Level:
+        return self.load(name)
+
+    def load(self, name: str) -> Level:
+        entry = self._entries[name]
+        tumblers_end = entry.offset + entry.tumblers * TUMBLER_SIZE
+        bindings_end = tumblers_end + entry.bindings * BINDING_SIZE
+
+        tumblers = {}
+        records = self._view[entry.offset : tumblers_end]
+        for position, upper, group, height, post_release_height, master in struct.iter_unpack(
+            PACK_TUMBLER_FORMAT, records
+        ):
+            location = Location(position, upper)
+            base = BaseTumbler(location, group, height, entry.max_height, post_release_height, master)
+            tumblers[location] = Tumbler(base)
+
+        bindings = {}
+        records = self._view[tumblers_end:bindings_end]
+        for position, upper, target_position, target_upper, difference in struct.iter_unpack(
+            PACK_BINDING_FORMAT, records
+        ):
+            bindings.setdefault(Location(position, upper), {})[Location(target_position, target_upper)] = difference
+
+        return Level(entry.number_of_picks, entry.max_height, tumblers, bindings)
+
+    def close(self):
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+    @property
+    def entries(self) -> List[PackEntry]:
+        return list(self._entries.values())
+
+    def _read_index(self, path: Union[str, os.PathLike]) -> Dict[str, PackEntry]:
+        if len(self._view) < HEADER_SIZE:
+            self.close()
+            raise ValueError(f"{path} is not a level pack")
+
+        magic, version, count = struct.unpack_from(PACK_HEADER_FORMAT, self._view)
+        if magic != PACK_MAGIC or version != PACK_VERSION or len(self._view) < HEADER_SIZE + count * INDEX_SIZE:
+            self.close()
+            raise ValueError(f"{path} is not a level pack of version {PACK_VERSION}")
+
+        entries = {}
+        index = self._view[HEADER_SIZE : HEADER_SIZE + count * INDEX_SIZE]
+        for name, *fields in struct.iter_unpack(PACK_INDEX_FORMAT, index):
+            entry = PackEntry(name.rstrip(b"\0").decode(), *fields)
+            end = entry.offset + entry.tumblers * TUMBLER_SIZE + entry.bindings * BINDING_SIZE
+            if end > len(self._view):
+                index.release()
+                self.close()
+                raise ValueError(f"Level {entry.name} exceeds the size of {path}")
+            if entry.name in entries:
+                index.release()
+                self.close()
+                raise ValueError(f"Duplicate level name {entry.name} in {path}")
+
+            entries[entry.name] = entry
+
+        index.release()
+        return entries
+
+
+def save_pack(filepath: Union[str, os.PathLike], levels: Mapping[str, Level]):
+    bindings = {
+        name: [
+            (source, target, difference)
+            for source, targets in level.bindings.items()
+            for target, difference in targets.items()
+        ]
+        for name, level in levels.items()
+    }
+    size = HEADER_SIZE + len(levels) * INDEX_SIZE
+    size += sum(
+        len(level.tumblers) * TUMBLER_SIZE + len(bindings[name]) * BINDING_SIZE for name, level in levels.items()
+    )
+
+    buffer = bytearray(size)
+    struct.pack_into(PACK_HEADER_FORMAT, buffer, 0, PACK_MAGIC, PACK_VERSION, len(levels))
+    index_offset = HEADER_SIZE
+    offset = HEADER_SIZE + len(levels) * INDEX_SIZE
+    for name, level in levels.items():
+        encoded_name = name.encode()
+        if len(encoded_name) > NAME_SIZE:
+            raise ValueError(f"Level name {name} is longer than {NAME_SIZE} bytes")
+
+        level_bindings = bindings[name]
+        struct.pack_into(
+            PACK_INDEX_FORMAT,
+            buffer,
+            index_offset,
+            encoded_name,
+            offset,
+            level.number_of_picks,
+            level.max_height,
+            len(level.tumblers),
+            len(level_bindings),
+        )
+        index_offset += INDEX_SIZE
+
+        for location, tumbler in level.tumblers.items():
+            struct.pack_into(
+                PACK_TUMBLER_FORMAT,
+                buffer,
+                offset,
+                location.position,
+                location.upper,
+                tumbler.group,
+                tumbler.base_height,
+                tumbler.post_release_height,
+                tumbler.master,
+            )
+            offset += TUMBLER_SIZE
+
+        for source, target, difference in level_bindings:
+            struct.pack_into(PACK_BINDING_FORMAT, buffer, offset, *source, *target, difference)
+            offset += BINDING_SIZE
+
+    with open(filepath, "wb") as file:
+        file.write(buffer)
+
+
+def pack_levels(paths: Iterable[Path], filepath: Union[str, os.PathLike]):
+    levels = {}
+    for path in paths:
+        if path.stem in levels:
+            raise ValueError(f"Duplicate level name {path.stem} in {path}")
+
+        levels[path.stem] = Level.load(path)
+
+    save_pack(filepath, levels)
+
+
+def unpack_levels(filepath: Union[str, os.PathLike], directory: Path):
+    directory.mkdir(parents=True, exist_ok=True)
+    with LevelPack(filepath) as pack:
+        for name in pack:
+            pack.load(name).save(directory / f"{name}.lvl")
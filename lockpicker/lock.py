@@ -1,21 +1,30 @@
 import random
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from lockpicker.level.level import Level
+from lockpicker.solver.solution import Move, MoveSequenceResult
+from lockpicker.state.history import Recording, StateHistory
+from lockpicker.state.state import State
+from lockpicker.state.zobrist import ZobristHash
+from lockpicker.tumbler.base import BaseTumbler
 from lockpicker.tumbler.location import Location
 from lockpicker.tumbler.tumbler import Tumbler
 
 
 class Lock:
-    def __init__(self, level: Level):
+    def __init__(self, level: Level, recording: Recording = Recording.BOUNDED):
         self._level = level
-        self._level_copy = level.copy()
         self._validate_level()
 
+        self._zobrist: Optional[ZobristHash] = None
+        self._history = StateHistory(recording)
+        self._initial_bases: Optional[Tuple[BaseTumbler, ...]] = None
+        self._initial_state: Optional[State] = None
+        self._tumblers: List[Tumbler] = []
+        self._index_tumblers()
         self._picks = self._create_picks()
 
         self._current_pick = 0
-        self._states = [self._get_state()]
 
     def push(self, location: Location):
         tumbler = self.get_tumbler(location)
@@ -32,39 +41,79 @@ class Lock:
 
     def add_tumbler(self, tumbler: Tumbler):
         if tumbler not in self.level.tumblers:
+            self._reset_hash()
             self.level.add_tumbler(tumbler)
+            self._index_tumblers()
 
     def remove_tumbler(self, tumbler: Tumbler):
+        self._reset_hash()
         self.level.remove_tumbler(tumbler)
+        self._index_tumblers()
 
     def add_binding(self, initial_location: Location, target_location: Location, difference: int):
+        self._reset_hash()
         self.level.add_binding(initial_location, target_location, difference)
 
+    def apply_moves(self, moves: Iterable[Move], fast_forward: bool = False) -> MoveSequenceResult:
+        recording = self._history.mode
+        if fast_forward:
+            self._history.mode = Recording.OFF
+        try:
+            return self._apply_moves(moves)
+        finally:
+            if fast_forward:
+                self._history.mode = recording
+                self._history.reset(self._get_state())
+
     def get_recent_changes(self) -> List[Dict[Location, Tuple[int, int]]]:
-        changes = []
-        for i in range(len(self._states) - 1):
-            current_state = self._states[i]
-            next_state = self._states[i + 1]
-            state_changes = {}
-            for location, height in current_state.items():
-                state_changes[location] = (height, next_state.get(location))
+        return self._history.flush()
 
-            if state_changes:
-                changes.append(state_changes)
+    def reset(self):
+        bases = tuple(tumbler.base for tumbler in self._tumblers)
+        if bases != self._initial_bases:
+            self._initial_bases = bases
+            self._initial_state = self._create_initial_state()
 
-        self._states = [self._states[-1]]
-        return list(reversed(changes))
+        self.restore(self._initial_state)
 
-    def reset(self):
-        self.level = self._level_copy
+    def snapshot(self) -> State:
+        tumblers = tuple(tumbler.state.pack() for tumbler in self._tumblers)
+        return State(tumblers, tuple(self._picks.values()), self._current_pick)
+
+    def restore(self, state: State):
+        if len(state.tumblers) != len(self._tumblers) or len(state.picks) != len(self._picks):
+            raise ValueError("State does not match the layout of this lock")
+
+        for tumbler, packed in zip(self._tumblers, state.tumblers):
+            tumbler.restore(packed)
+
+        for pick, location in enumerate(state.picks):
+            self._set_pick(pick, location)
+
+        self._current_pick = state.current_pick
+        self._invalidate_moves()
+        self._history.reset(self._get_state())
+
+    def get_hash(self) -> int:
+        if self._zobrist is None:
+            self._zobrist = self._create_zobrist_hash()
+            for tumbler in self._tumblers:
+                tumbler.attach_hash(self._zobrist)
+            for pick, location in self._picks.items():
+                self._zobrist.value ^= self._zobrist.pick_key(pick, self._zobrist.index(location))
+
+        return self._zobrist.value
 
-    def play_random_move(self):
+    def play_random_move(self) -> Optional[Tuple[int, Location]]:
         moves = self.get_possible_moves()
         if moves:
             move = random.choice(moves)
             pick = random.choice(range(self.level.number_of_picks))
             self.select_pick(pick)
             self.push(move)
+            return pick, move
+
+        return None
 
     def check_win(self) -> bool:
         for tumbler in self._level.tumblers.values():
@@ -73,18 +122,11 @@ class Lock:
 
         return True
 
-    def get_possible_moves(self) -> List[Tuple[int, bool]]:
-        # TODO: consider state change after each move
-        moves = []
-        max_position = max([position for position, upper in self._level.tumblers])
-        for upper in [True, False]:
-            for position in reversed(range(max_position + 1)):
-                tumbler = self.get_tumbler(Location(position, upper))
-                if tumbler is not None and self._check_previous_tumblers(tumbler):
-                    moves.extend([Location(pos, upper) for pos in range(position + 1)])
-                    break
+    def get_possible_moves(self) -> List[Location]:
+        if self._possible_moves is None:
+            self._possible_moves = self._find_possible_moves()
 
-        return moves
+        return list(self._possible_moves)
 
     def get_pick(self, pick: int) -> Optional[Location]:
         return self._picks.get(pick)
@@ -104,10 +146,23 @@ class Lock:
     def get_tumblers_by_location(self) -> Dict[Location, Optional[Tumbler]]:
         return self._level.tumblers
 
+    def get_heights(self) -> Dict[Location, int]:
+        return self._get_state()
+
     def _initialize_state(self):
+        self._reset_hash()
+        self._index_tumblers()
         self._current_pick = 0
         self._picks = self._create_picks()
-        self._states = [self._get_state()]
+
+    def _create_initial_state(self) -> State:
+        tumblers = {tumbler.location: Tumbler(tumbler.base) for tumbler in self._tumblers}
+        for location, tumbler in tumblers.items():
+            tumbler.counter = tumblers.get(location.counter)
+
+        return State(
+            tuple(tumbler.state.pack() for tumbler in tumblers.values()), (None,) * self._level.number_of_picks, 0
+        )
 
     def _can_push_tumbler(self, tumbler: Optional[Tumbler]) -> bool:
         return tumbler is not None and self._check_previous_tumblers(tumbler)
@@ -157,7 +212,21 @@ class Lock:
         return state
 
     def _add_current_state(self):
-        self._states.append(self._get_state())
+        self._history.step()
+
+    def _apply_moves(self, moves: Iterable[Move]) -> MoveSequenceResult:
+        applied = 0
+        for index, (pick, location) in enumerate(moves):
+            if not 0 <= pick < self.level.number_of_picks or location not in self.get_possible_moves():
+                return MoveSequenceResult(applied, illegal=index)
+
+            self.select_pick(pick)
+            self.push(location)
+            applied += 1
+            if self.check_win():
+                return MoveSequenceResult(applied, win=index)
+
+        return MoveSequenceResult(applied)
 
     def _apply_bindings(self, location: Location, pushed: bool):
         tumbler = self.get_tumbler(location)
@@ -191,6 +260,71 @@ class Lock:
 
         self._add_current_state()
 
+    def _index_tumblers(self):
+        for tumbler in self._tumblers:
+            tumbler.listeners.remove(self._on_height_change)
+
+        self._tumblers = [tumbler for tumbler in self._level.tumblers.values() if tumbler is not None]
+        self._initial_bases = None
+        width = max((tumbler.position for tumbler in self._tumblers), default=-1) + 1
+        rows = {upper: [None] * width for upper in (True, False)}
+        for tumbler in self._tumblers:
+            rows[tumbler.upper][tumbler.position] = tumbler
+            tumbler.listeners.append(self._on_height_change)
+
+        self._rows = [
+            (rows[upper], rows[not upper], [Location(position, upper) for position in range(width)])
+            for upper in (True, False)
+        ]
+        self._invalidate_moves()
+        self._history.reset(self._get_state())
+
+    def _on_height_change(self, tumbler: Tumbler):
+        position = tumbler.position
+        row = 0 if tumbler.upper else 1
+        if position <= self._row_limits[row]:
+            self._row_moves[row] = None
+            self._possible_moves = None
+        if position <= self._row_limits[1 - row]:
+            self._row_moves[1 - row] = None
+            self._possible_moves = None
+
+        self._history.change(tumbler.location, tumbler.height)
+
+    def _invalidate_moves(self):
+        self._row_moves: List[Optional[List[Location]]] = [None, None]
+        self._row_limits = [len(row) for row, _, _ in self._rows]
+        self._possible_moves = None
+
+    def _find_possible_moves(self) -> List[Location]:
+        moves = []
+        for row in range(2):
+            if self._row_moves[row] is None:
+                self._row_moves[row] = self._find_row_moves(row)
+            moves.extend(self._row_moves[row])
+
+        return moves
+
+    def _find_row_moves(self, row: int) -> List[Location]:
+        tumblers, counters, locations = self._rows[row]
+        max_height = self.level.max_height
+        last_position = -1
+        counter_height: Optional[int] = None
+        limit = len(tumblers)
+        for position, tumbler in enumerate(tumblers):
+            counter = counters[position]
+            if counter is not None and (counter_height is None or counter.height > counter_height):
+                counter_height = counter.height
+            if tumbler is not None:
+                if counter_height is None or tumbler.height + counter_height < max_height:
+                    last_position = position
+                if not tumbler.free:
+                    limit = position
+                    break
+
+        self._row_limits[row] = limit
+        return locations[: last_position + 1]
+
     def _create_picks(self) -> Dict[int, Optional[Location]]:
         return {pick: None for pick in range(self.level.number_of_picks)}
 
@@ -198,7 +332,15 @@ class Lock:
         return self._picks[self._current_pick]
 
     def _set_current_pick(self, location: Location):
-        self._picks[self._current_pick] = location
+        self._set_pick(self._current_pick, location)
+
+    def _set_pick(self, pick: int, location: Optional[Location]):
+        zobrist = self._zobrist
+        if zobrist is not None:
+            previous = zobrist.pick_key(pick, zobrist.index(self._picks[pick]))
+            zobrist.value ^= previous ^ zobrist.pick_key(pick, zobrist.index(location))
+
+        self._picks[pick] = location
 
     def _get_other_picks(self, location: Location) -> List[int]:
         return [
@@ -237,11 +379,36 @@ class Lock:
 
     def _clear_pick(self, pick: Optional[int] = None):
         pick = pick if pick is not None else self._current_pick
-        self._picks[pick] = None
+        self._set_pick(pick, None)
+
+    def _reset_hash(self):
+        if self._zobrist is not None:
+            for tumbler in self._tumblers:
+                tumbler.attach_hash(None)
+
+        self._zobrist = None
+
+    def _create_zobrist_hash(self) -> ZobristHash:
+        differences = [abs(difference) for bindings in self.level.bindings.values() for difference in bindings.values()]
+        return ZobristHash(
+            (tumbler.location for tumbler in self._tumblers),
+            self.level.number_of_picks,
+            max((tumbler.max_height for tumbler in self._tumblers), default=self.level.max_height),
+            max(differences, default=0),
+        )
 
     def _validate_level(self):
         self.level.validate()
 
+    @property
+    def recording(self) -> Recording:
+        return self._history.mode
+
+    @recording.setter
+    def recording(self, recording: Recording):
+        self._history.mode = recording
+        self._history.reset(self._get_state())
+
     @property
     def current_pick(self) -> int:
         return self._current_pick
@@ -253,6 +420,5 @@ class Lock:
     @level.setter
     def level(self, level: Level):
         self._level = level
-        self._level_copy = level.copy()
         self._level.validate()
         self._initialize_state()
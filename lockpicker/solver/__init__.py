@@ -0,0 +1,4 @@
+MAX_STATES = 1_000_000
+TABLE_SIZE = 1 << 16
+DENSE_STATES = 4096
+ABSORPTION_TOLERANCE = 1e-12
@@ -0,0 +1,127 @@
+import heapq
+import itertools
+import math
+from typing import Dict, List, Optional, Set, Tuple
+
+from lockpicker.solver import MAX_STATES
+from lockpicker.solver.heuristics import UNSOLVED, Heuristic
+from lockpicker.solver.solution import Move, Solution
+from lockpicker.solver.successors import SearchLock, canonical_snapshot, expand, reconstruct_moves
+from lockpicker.solver.transposition import TranspositionTable
+from lockpicker.state.state import State
+
+
+def solve(
+    lock: SearchLock,
+    heuristic: Heuristic = UNSOLVED,
+    weight: float = 1.0,
+    max_states: int = MAX_STATES,
+) -> Solution:
+    initial_state = lock.snapshot()
+    optimal = heuristic.admissible and weight <= 1.0
+    start = canonical_snapshot(lock)
+    if lock.check_win():
+        lock.restore(initial_state)
+        return Solution([], 0, 1)
+
+    parents: Dict[State, Optional[Tuple[State, Move]]] = {start: None}
+    costs = {start: 0}
+    counter = itertools.count()
+    queue = [(weight * heuristic(lock.get_heights()), next(counter), start)]
+    expanded = 0
+    try:
+        while queue:
+            _, _, state = heapq.heappop(queue)
+            lock.restore(state)
+            if lock.check_win():
+                return Solution(reconstruct_moves(parents, state), expanded, len(parents), optimal=optimal)
+
+            expanded += 1
+            cost = costs[state] + 1
+            for move, child in expand(lock, state):
+                if cost >= costs.get(child, math.inf):
+                    continue
+
+                parents[child] = (state, move)
+                costs[child] = cost
+                if len(parents) >= max_states:
+                    return Solution(None, expanded, len(parents), complete=False)
+
+                priority = cost + weight * heuristic(lock.get_heights())
+                heapq.heappush(queue, (priority, next(counter), child))
+
+        return Solution(None, expanded, len(parents))
+    finally:
+        lock.restore(initial_state)
+
+
+def solve_ida(
+    lock: SearchLock,
+    heuristic: Heuristic = UNSOLVED,
+    max_states: int = MAX_STATES,
+    table: Optional[TranspositionTable] = None,
+) -> Solution:
+    initial_state = lock.snapshot()
+    start = canonical_snapshot(lock)
+    table = TranspositionTable() if table is None else table
+    search = _IterativeDeepening(lock, heuristic, max_states, table)
+    try:
+        bound = heuristic(lock.get_heights())
+        while True:
+            result = search.search(start, 0, bound, {start})
+            if result is None:
+                return Solution(list(search.path), search.expanded, search.visited, optimal=heuristic.admissible)
+            if search.expanded >= max_states:
+                return Solution(None, search.expanded, search.visited, complete=False)
+            if result == math.inf:
+                return Solution(None, search.expanded, search.visited)
+
+            bound = result
+    finally:
+        lock.restore(initial_state)
+
+
+class _IterativeDeepening:
+    def __init__(self, lock: SearchLock, heuristic: Heuristic, max_states: int, table: TranspositionTable):
+        self.lock = lock
+        self.heuristic = heuristic
+        self.max_states = max_states
+        self.table = table
+        self.path: List[Move] = []
+        self.expanded = 0
+        self.visited = 1
+
+    def search(self, state: State, cost: int, bound: float, on_path: Set[State]) -> Optional[float]:
+        self.lock.restore(state)
+        if self.lock.check_win():
+            return None
+
+        estimate = cost + self.heuristic(self.lock.get_heights())
+        if estimate > bound:
+            return estimate
+        if self.expanded >= self.max_states:
+            return math.inf
+
+        key = self.lock.get_hash()
+        depth = bound - cost
+        entry = self.table.lookup(key)
+        if entry is not None and entry[1] == bound and entry[0] >= depth:
+            return math.inf
+
+        self.table.store(key, depth, bound)
+        self.expanded += 1
+        minimum = math.inf
+        children = [(move, child) for move, child in expand(self.lock, state) if child not in on_path]
+        self.visited += len(children)
+        for move, child in children:
+            self.path.append(move)
+            on_path.add(child)
+            result = self.search(child, cost + 1, bound, on_path)
+            if result is None:
+                return None
+
+            on_path.discard(child)
+            self.path.pop()
+            minimum = min(minimum, result)
+
+        return minimum
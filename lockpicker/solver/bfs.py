@@ -0,0 +1,51 @@
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from lockpicker.solver import MAX_STATES
+from lockpicker.solver.solution import Move, Solution
+from lockpicker.solver.successors import SearchLock, canonical_snapshot, expand, reconstruct_moves
+from lockpicker.state.state import State
+
+
+def solve(lock: SearchLock, max_states: int = MAX_STATES, warm_start: Optional[List[Move]] = None) -> Solution:
+    initial_state = lock.snapshot()
+    if lock.check_win():
+        return Solution([], 0, 1)
+
+    start = canonical_snapshot(lock)
+    warm_start = _validate_warm_start(lock, warm_start) if warm_start is not None else None
+    parents: Dict[State, Optional[Tuple[State, Move]]] = {start: None}
+    queue = deque([(start, 0)])
+    max_depth = len(warm_start) - 1 if warm_start is not None else None
+    expanded = 0
+    try:
+        while queue:
+            state, depth = queue.popleft()
+            if max_depth is not None and depth >= max_depth:
+                continue
+
+            expanded += 1
+            for move, child in expand(lock, state):
+                if child in parents:
+                    continue
+
+                parents[child] = (state, move)
+                if lock.check_win():
+                    return Solution(reconstruct_moves(parents, child), expanded, len(parents))
+                if len(parents) >= max_states:
+                    return Solution(warm_start, expanded, len(parents), complete=False)
+
+                queue.append((child, depth + 1))
+
+        return Solution(warm_start, expanded, len(parents))
+    finally:
+        lock.restore(initial_state)
+
+
+def _validate_warm_start(lock: SearchLock, moves: List[Move]) -> Optional[List[Move]]:
+    state = lock.snapshot()
+    try:
+        result = lock.apply_moves(moves, fast_forward=True)
+        return list(moves[: result.win + 1]) if result.legal and result.solved else None
+    finally:
+        lock.restore(state)
@@ -0,0 +1,188 @@
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from lockpicker.agents import MAX_MOVES
+from lockpicker.solver import ABSORPTION_TOLERANCE, DENSE_STATES, MAX_STATES
+from lockpicker.solver.successors import SearchLock, canonical_snapshot, expand
+from lockpicker.state.state import State
+
+
+@dataclass
+class StateGraph:
+    offsets: np.ndarray
+    targets: np.ndarray
+    depths: np.ndarray
+    wins: np.ndarray
+    complete: bool = True
+
+    @property
+    def states(self) -> int:
+        return len(self.wins)
+
+    @property
+    def degrees(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    @property
+    def sources(self) -> np.ndarray:
+        return np.repeat(np.arange(self.states), self.degrees)
+
+
+@dataclass
+class DifficultyReport:
+    states: int
+    complete: bool
+    length: Optional[int] = None
+    solutions: int = 0
+    dead_ends: Optional[float] = None
+    solve_probability: Optional[float] = None
+    eventual_probability: Optional[float] = None
+    max_moves: int = MAX_MOVES
+
+    @property
+    def solvable(self) -> bool:
+        return self.length is not None
+
+
+def build_state_graph(lock: SearchLock, max_states: int = MAX_STATES) -> StateGraph:
+    initial_state = lock.snapshot()
+    try:
+        start = canonical_snapshot(lock)
+        indices: Dict[State, int] = {start: 0}
+        depths = array("l", [0])
+        wins = array("b", [lock.check_win()])
+        offsets = array("l", [0])
+        targets = array("l")
+        queue = deque([start])
+        while queue:
+            state = queue.popleft()
+            index = indices[state]
+            if not wins[index]:
+                for _, child in expand(lock, state):
+                    child_index = indices.get(child)
+                    if child_index is None:
+                        if len(indices) >= max_states:
+                            return _create_graph(offsets, targets, depths, wins, complete=False)
+
+                        child_index = len(indices)
+                        indices[child] = child_index
+                        depths.append(depths[index] + 1)
+                        wins.append(lock.check_win())
+                        queue.append(child)
+
+                    targets.append(child_index)
+
+            offsets.append(len(targets))
+
+        return _create_graph(offsets, targets, depths, wins)
+    finally:
+        lock.restore(initial_state)
+
+
+def count_optimal_solutions(graph: StateGraph) -> int:
+    counts: List[int] = [0] * graph.states
+    counts[0] = 1
+    depths = graph.depths.tolist()
+    targets = graph.targets.tolist()
+    offsets = graph.offsets.tolist()
+    for index in range(graph.states):
+        for target in targets[offsets[index] : offsets[index + 1]]:
+            if depths[target] == depths[index] + 1:
+                counts[target] += counts[index]
+
+    winning_depths = graph.depths[graph.wins]
+    length = winning_depths.min()
+    return sum(counts[index] for index in np.flatnonzero(graph.wins & (graph.depths == length)))
+
+
+def find_reaching_states(graph: StateGraph, mask: np.ndarray) -> np.ndarray:
+    order = np.argsort(graph.targets, kind="stable")
+    predecessors = graph.sources[order]
+    bounds = np.searchsorted(graph.targets[order], np.arange(graph.states + 1))
+
+    reaching = mask.copy()
+    queue = deque(np.flatnonzero(reaching).tolist())
+    while queue:
+        index = queue.popleft()
+        for predecessor in predecessors[bounds[index] : bounds[index + 1]].tolist():
+            if not reaching[predecessor]:
+                reaching[predecessor] = True
+                queue.append(predecessor)
+
+    return reaching
+
+
+def solve_probabilities(graph: StateGraph, max_moves: int) -> np.ndarray:
+    sources = graph.sources
+    degrees = np.maximum(graph.degrees, 1)
+    probabilities = graph.wins.astype(np.float64)
+    for _ in range(max_moves):
+        probabilities = np.bincount(sources, probabilities[graph.targets], minlength=graph.states) / degrees
+        probabilities[graph.wins] = 1.0
+
+    return probabilities
+
+
+def absorption_probabilities(graph: StateGraph, live: np.ndarray) -> np.ndarray:
+    threatened = find_reaching_states(graph, ~live)
+    probabilities = (live & ~threatened).astype(np.float64)
+    transient = np.flatnonzero(live & threatened)
+    if not len(transient):
+        return probabilities
+
+    sources = graph.sources
+    weights = 1.0 / graph.degrees[sources]
+    if len(transient) <= DENSE_STATES:
+        positions = np.full(graph.states, -1)
+        positions[transient] = np.arange(len(transient))
+        rows = positions[sources]
+        columns = positions[graph.targets]
+
+        inner = (rows >= 0) & (columns >= 0)
+        matrix = np.eye(len(transient))
+        np.subtract.at(matrix, (rows[inner], columns[inner]), weights[inner])
+
+        outer = (rows >= 0) & (columns < 0)
+        vector = np.bincount(rows[outer], weights[outer] * probabilities[graph.targets[outer]], len(transient))
+        probabilities[transient] = np.linalg.solve(matrix, vector)
+        return probabilities
+
+    degrees = np.maximum(graph.degrees, 1)
+    while True:
+        updated = np.bincount(sources, probabilities[graph.targets], minlength=graph.states)[transient]
+        updated /= degrees[transient]
+        change = np.abs(updated - probabilities[transient]).max()
+        probabilities[transient] = updated
+        if change < ABSORPTION_TOLERANCE:
+            return probabilities
+
+
+def analyze(lock: SearchLock, max_states: int = MAX_STATES, max_moves: int = MAX_MOVES) -> DifficultyReport:
+    graph = build_state_graph(lock, max_states)
+    report = DifficultyReport(graph.states, graph.complete, max_moves=max_moves)
+    if not graph.complete:
+        return report
+
+    live = find_reaching_states(graph, graph.wins)
+    report.dead_ends = float(1.0 - live.mean())
+    report.solve_probability = float(solve_probabilities(graph, max_moves)[0])
+    report.eventual_probability = float(absorption_probabilities(graph, live)[0])
+    if graph.wins.any():
+        report.length = int(graph.depths[graph.wins].min())
+        report.solutions = count_optimal_solutions(graph)
+
+    return report
+
+
+def _create_graph(offsets: array, targets: array, depths: array, wins: array, complete: bool = True) -> StateGraph:
+    return StateGraph(
+        np.array(offsets, dtype=np.int64),
+        np.array(targets, dtype=np.int64),
+        np.array(depths, dtype=np.int64),
+        np.array(wins, dtype=bool),
+        complete,
+    )
@@ -0,0 +1,48 @@
+from collections import defaultdict
+from typing import Callable, Dict, NamedTuple
+
+from lockpicker.tumbler.location import Location
+
+Heights = Dict[Location, int]
+
+
+class Heuristic(NamedTuple):
+    function: Callable[[Heights], int]
+    admissible: bool
+
+    def __call__(self, heights: Heights) -> int:
+        return self.function(heights)
+
+
+def _null(heights: Heights) -> int:
+    return 0
+
+
+def _unsolved(heights: Heights) -> int:
+    return int(any(height > 1 for height in heights.values()))
+
+
+def _non_free_tumblers(heights: Heights) -> int:
+    return sum(height > 1 for height in heights.values())
+
+
+def _row_non_free_tumblers(heights: Heights) -> int:
+    rows = defaultdict(int)
+    for location, height in heights.items():
+        if height > 1:
+            rows[location.upper] += 1
+
+    return max(rows.values(), default=0)
+
+
+NULL = Heuristic(_null, admissible=True)
+UNSOLVED = Heuristic(_unsolved, admissible=True)
+NON_FREE_TUMBLERS = Heuristic(_non_free_tumblers, admissible=False)
+ROW_NON_FREE_TUMBLERS = Heuristic(_row_non_free_tumblers, admissible=False)
+
+HEURISTICS = {
+    "null": NULL,
+    "unsolved": UNSOLVED,
+    "non_free_tumblers": NON_FREE_TUMBLERS,
+    "row_non_free_tumblers": ROW_NON_FREE_TUMBLERS,
+}
@@ -0,0 +1,100 @@
+import os
+import time
+import tracemalloc
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from lockpicker.array_lock import ArrayLock
+from lockpicker.level.level import Level
+from lockpicker.solver import MAX_STATES
+from lockpicker.solver.solve import solve
+from lockpicker.solver.successors import SearchLock
+
+
+@dataclass
+class LevelReport:
+    path: str
+    valid: bool
+    solvable: Optional[bool] = None
+    complete: Optional[bool] = None
+    length: Optional[int] = None
+    expanded: int = 0
+    visited: int = 0
+    elapsed: float = 0.0
+    peak_memory: int = 0
+    warnings: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def solve_level(
+    path: Path,
+    solver: str = "bfs",
+    heuristic: str = "unsolved",
+    max_states: int = MAX_STATES,
+    lock_class: Type[SearchLock] = ArrayLock,
+    validate_only: bool = False,
+) -> LevelReport:
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        try:
+            level = Level.load(path)
+            level.validate()
+        except (AssertionError, OSError, ValueError) as error:
+            return LevelReport(str(path), valid=False, error=repr(error))
+
+    report = LevelReport(str(path), valid=True, warnings=[str(warning.message) for warning in caught])
+    if validate_only:
+        return report
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        solution = solve(lock_class(level), solver, heuristic, max_states=max_states)
+    finally:
+        report.elapsed = time.perf_counter() - start
+        report.peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    report.solvable = solution.solvable if solution.solvable or solution.complete else None
+    report.complete = solution.complete
+    report.length = solution.length
+    report.expanded = solution.expanded
+    report.visited = solution.visited
+    return report
+
+
+def solve_levels(
+    paths: Iterable[Path],
+    workers: Optional[int] = None,
+    solver: str = "bfs",
+    heuristic: str = "unsolved",
+    max_states: int = MAX_STATES,
+    lock_class: Type[SearchLock] = ArrayLock,
+    validate_only: bool = False,
+) -> List[LevelReport]:
+    paths = list(paths)
+    workers = min(workers or os.cpu_count() or 1, max(len(paths), 1))
+    arguments = (solver, heuristic, max_states, lock_class, validate_only)
+    if workers == 1:
+        return [solve_level(path, *arguments) for path in paths]
+
+    with ProcessPoolExecutor(workers) as executor:
+        futures = [executor.submit(solve_level, path, *arguments) for path in paths]
+        return [future.result() for future in futures]
+
+
+def summarize(reports: List[LevelReport], elapsed: float) -> Dict[str, Any]:
+    return {
+        "levels": len(reports),
+        "invalid": sum(not report.valid for report in reports),
+        "solvable": sum(report.solvable is True for report in reports),
+        "unsolvable": sum(report.solvable is False for report in reports),
+        "unknown": sum(report.complete is False and report.solvable is None for report in reports),
+        "expanded": sum(report.expanded for report in reports),
+        "cpu_time": sum(report.elapsed for report in reports),
+        "elapsed": elapsed,
+        "reports": [asdict(report) for report in reports],
+    }
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from typing import List, NamedTuple, Optional, Tuple
+
+from lockpicker.tumbler.location import Location
+
+Move = Tuple[int, Location]
+
+
+@dataclass
+class Solution:
+    moves: Optional[List[Move]]
+    expanded: int
+    visited: int
+    complete: bool = True
+    optimal: bool = True
+
+    @property
+    def solvable(self) -> bool:
+        return self.moves is not None
+
+    @property
+    def length(self) -> Optional[int]:
+        return len(self.moves) if self.moves is not None else None
+
+
+class MoveSequenceResult(NamedTuple):
+    applied: int
+    illegal: Optional[int] = None
+    win: Optional[int] = None
+
+    @property
+    def legal(self) -> bool:
+        return self.illegal is None
+
+    @property
+    def solved(self) -> bool:
+        return self.win is not None
@@ -0,0 +1,17 @@
+from lockpicker.solver import MAX_STATES, astar, bfs
+from lockpicker.solver.heuristics import HEURISTICS
+from lockpicker.solver.solution import Solution
+from lockpicker.solver.successors import SearchLock
+
+SOLVERS = ["bfs", "astar", "ida"]
+
+
+def solve(lock: SearchLock, solver: str = "bfs", heuristic: str = "unsolved", max_states: int = MAX_STATES) -> Solution:
+    if solver == "astar":
+        return astar.solve(lock, HEURISTICS[heuristic], max_states=max_states)
+    if solver == "ida":
+        return astar.solve_ida(lock, HEURISTICS[heuristic], max_states=max_states)
+    if solver == "bfs":
+        return bfs.solve(lock, max_states=max_states)
+
+    raise ValueError(f"Unknown solver: {solver}")
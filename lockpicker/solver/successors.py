@@ -0,0 +1,33 @@
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from lockpicker.array_lock import ArrayLock
+from lockpicker.lock import Lock
+from lockpicker.solver.solution import Move
+from lockpicker.state.state import State
+
+SearchLock = Union[Lock, ArrayLock]
+
+
+def canonical_snapshot(lock: SearchLock) -> State:
+    lock.select_pick(0)
+    return lock.snapshot()
+
+
+def expand(lock: SearchLock, state: State) -> Iterator[Tuple[Move, State]]:
+    lock.restore(state)
+    moves = lock.get_possible_moves()
+    for pick in range(lock.level.number_of_picks):
+        for location in moves:
+            lock.restore(state)
+            lock.select_pick(pick)
+            lock.push(location)
+            yield (pick, location), canonical_snapshot(lock)
+
+
+def reconstruct_moves(parents: Dict[State, Optional[Tuple[State, Move]]], state: State) -> List[Move]:
+    moves = []
+    while parents[state] is not None:
+        state, move = parents[state]
+        moves.append(move)
+
+    return list(reversed(moves))
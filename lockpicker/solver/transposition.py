@@ -0,0 +1,57 @@
+from enum import Enum
+from typing import Optional, Tuple
+
+from lockpicker.solver import TABLE_SIZE
+
+
+class ReplacementPolicy(Enum):
+    ALWAYS = "always"
+    DEPTH = "depth"
+
+
+class TranspositionTable:
+    def __init__(self, size: int = TABLE_SIZE, policy: ReplacementPolicy = ReplacementPolicy.DEPTH):
+        if size < 1:
+            raise ValueError(f"Table size must be at least 1, got {size}")
+
+        self._size = size
+        self._policy = policy
+        self._keys = [None] * size
+        self._depths = [0] * size
+        self._values = [0] * size
+        self.stores = 0
+        self.hits = 0
+
+    def lookup(self, key: int) -> Optional[Tuple[int, int]]:
+        slot = key % self._size
+        if self._keys[slot] != key:
+            return None
+
+        self.hits += 1
+        return self._depths[slot], self._values[slot]
+
+    def store(self, key: int, depth: int, value: int):
+        slot = key % self._size
+        if (
+            self._policy is ReplacementPolicy.DEPTH
+            and self._keys[slot] is not None
+            and self._keys[slot] != key
+            and self._depths[slot] > depth
+        ):
+            return
+
+        self._keys[slot] = key
+        self._depths[slot] = depth
+        self._values[slot] = value
+        self.stores += 1
+
+    def clear(self):
+        self._keys = [None] * self._size
+
+    @property
+    def policy(self) -> ReplacementPolicy:
+        return self._policy
+
+    @property
+    def size(self) -> int:
+        return self._size
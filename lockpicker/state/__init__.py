@@ -0,0 +1 @@
+HISTORY_SIZE = 256
@@ -0,0 +1,56 @@
+from collections import deque
+from enum import Enum
+from typing import Deque, Dict, List, Tuple
+
+from lockpicker.state import HISTORY_SIZE
+from lockpicker.tumbler.location import Location
+
+
+class Recording(Enum):
+    OFF = "off"
+    BOUNDED = "bounded"
+    FULL = "full"
+
+
+class StateHistory:
+    def __init__(self, mode: Recording = Recording.BOUNDED, size: int = HISTORY_SIZE):
+        if size < 1:
+            raise ValueError(f"History size must be at least 1, got {size}")
+
+        self.mode = mode
+        self.size = size
+        self._heights: Dict[Location, int] = {}
+        self._deltas: Deque[Dict[Location, int]] = deque()
+        self._changes: Dict[Location, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._deltas)
+
+    def reset(self, heights: Dict[Location, int]):
+        self._heights = heights
+        self._deltas.clear()
+        self._changes = {}
+
+    def change(self, location: Location, height: int):
+        if self.mode is not Recording.OFF:
+            self._changes[location] = height
+
+    def step(self):
+        if self.mode is Recording.OFF:
+            return
+
+        if self.mode is Recording.BOUNDED and len(self._deltas) >= self.size:
+            self._heights.update(self._deltas.popleft())
+
+        self._deltas.append(self._changes)
+        self._changes = {}
+
+    def flush(self) -> List[Dict[Location, Tuple[int, int]]]:
+        changes = []
+        heights = self._heights
+        for delta in self._deltas:
+            changes.append({location: (height, delta.get(location, height)) for location, height in heights.items()})
+            heights.update(delta)
+
+        self._deltas.clear()
+        return list(reversed(changes))
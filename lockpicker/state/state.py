@@ -2,10 +2,11 @@ from dataclasses import dataclass
 from typing import Optional, Tuple
 
 from lockpicker.tumbler.location import Location
-from lockpicker.tumbler.state import TumblerState
+from lockpicker.tumbler.state import PackedTumblerState
 
 
 @dataclass(frozen=True)
 class State:
-    tumblers: Tuple[TumblerState, ...]
-    picks: Tuple[Tuple[int, Optional[Location]], ...]
+    tumblers: Tuple[PackedTumblerState, ...]
+    picks: Tuple[Optional[Location], ...]
+    current_pick: int = 0
@@ -0,0 +1,50 @@
+import random
+from typing import Dict, Iterable, List, Optional
+
+from lockpicker.tumbler.location import Location
+
+ZOBRIST_SEED = 0x10C4
+
+
+class ZobristHash:
+    def __init__(
+        self,
+        locations: Iterable[Location],
+        number_of_picks: int,
+        max_height: int,
+        max_difference: int = 0,
+        seed: int = ZOBRIST_SEED,
+    ):
+        self._indices: Dict[Location, int] = {location: index for index, location in enumerate(sorted(locations))}
+        self._offset = max_difference
+
+        generator = random.Random(seed)
+        size = len(self._indices)
+        self._heights = self._draw(generator, size, max_height + 1)
+        self._pushed = self._draw(generator, 1, size)[0]
+        self._jammed = self._draw(generator, 1, size)[0]
+        self._released = self._draw(generator, 1, size)[0]
+        self._differences = self._draw(generator, size, 2 * max_difference + 1)
+        self._picks = self._draw(generator, number_of_picks, size + 1)
+        self.value = 0
+
+    def index(self, location: Optional[Location]) -> int:
+        return self._indices[location] if location is not None else -1
+
+    def tumbler_key(self, index: int, height: int, pushed: bool, jammed: bool, release: bool, difference: int) -> int:
+        key = self._heights[index][height] ^ self._differences[index][difference + self._offset]
+        if pushed:
+            key ^= self._pushed[index]
+        if jammed:
+            key ^= self._jammed[index]
+        if release:
+            key ^= self._released[index]
+
+        return key
+
+    def pick_key(self, pick: int, index: int) -> int:
+        return self._picks[pick][index + 1]
+
+    @staticmethod
+    def _draw(generator: random.Random, rows: int, columns: int) -> List[List[int]]:
+        return [[generator.getrandbits(64) for _ in range(columns)] for _ in range(rows)]
@@ -1,9 +1,12 @@
 import struct
 from dataclasses import dataclass
+from typing import Tuple
 
 from lockpicker.tumbler import STRUCT_FORMAT
 from lockpicker.tumbler.location import Location
 
+TUMBLER_STRUCT = struct.Struct(STRUCT_FORMAT)
+
 
 @dataclass(frozen=True)
 class BaseTumbler:
@@ -15,8 +18,19 @@ class BaseTumbler:
     master: bool = False
 
     def serialize(self) -> bytes:
-        return struct.pack(
-            STRUCT_FORMAT,
+        return TUMBLER_STRUCT.pack(
+            self.location.position,
+            self.location.upper,
+            self.group,
+            self.height,
+            self.post_release_height,
+            self.master,
+        )
+
+    def serialize_into(self, buffer: bytearray, offset: int):
+        TUMBLER_STRUCT.pack_into(
+            buffer,
+            offset,
             self.location.position,
             self.location.upper,
             self.group,
@@ -27,5 +41,9 @@ class BaseTumbler:
 
     @classmethod
     def deserialize(cls, data: bytes, max_height: int) -> "BaseTumbler":
-        position, upper, group, height, post_release_height, master = struct.unpack(STRUCT_FORMAT, data)
+        return cls.from_fields(TUMBLER_STRUCT.unpack(data), max_height)
+
+    @classmethod
+    def from_fields(cls, fields: Tuple[int, bool, int, int, int, bool], max_height: int) -> "BaseTumbler":
+        position, upper, group, height, post_release_height, master = fields
         return BaseTumbler(Location(position, upper), group, height, max_height, post_release_height, master)
@@ -1,4 +1,7 @@
 from dataclasses import dataclass, replace
+from typing import Tuple
+
+PackedTumblerState = Tuple[int, bool, bool, bool, int]
 
 
 @dataclass
@@ -11,3 +14,9 @@ class TumblerState:
 
     def copy(self):
         return replace(self)
+
+    def pack(self) -> PackedTumblerState:
+        return self.current_height, self.pushed, self.jammed, self.release, self.difference
+
+    def unpack(self, packed: PackedTumblerState):
+        self.current_height, self.pushed, self.jammed, self.release, self.difference = packed
@@ -1,9 +1,10 @@
 from dataclasses import replace
-from typing import Optional
+from typing import Callable, List, Optional
 
+from lockpicker.state.zobrist import ZobristHash
 from lockpicker.tumbler.base import BaseTumbler
 from lockpicker.tumbler.location import Location
-from lockpicker.tumbler.state import TumblerState
+from lockpicker.tumbler.state import PackedTumblerState, TumblerState
 
 
 class Tumbler:
@@ -16,6 +17,10 @@ class Tumbler:
         self._base = base
         self._state = TumblerState(base.height) if state is None else state
         self._counter = counter
+        self._zobrist: Optional[ZobristHash] = None
+        self._zobrist_index = -1
+        self._zobrist_key = 0
+        self.listeners: List[Callable[["Tumbler"], None]] = []
 
     def __repr__(self) -> str:
         return (
@@ -36,6 +41,7 @@ class Tumbler:
         self._state.release = False
         self._state.jammed = True
         self._state.pushed = True
+        self._update_hash()
 
     def push(self):
         self._state.release = False
@@ -45,6 +51,7 @@ class Tumbler:
     def unjam(self):
         self._state.release = False
         self._state.jammed = False
+        self._update_hash()
 
     def release(self, direct: bool = False):
         self._state.jammed = False
@@ -55,6 +62,20 @@ class Tumbler:
 
         self._recalculate_current_height()
 
+    def restore(self, packed: PackedTumblerState):
+        self._state.unpack(packed)
+        self._update_hash()
+
+    def attach_hash(self, zobrist: Optional[ZobristHash]):
+        if self._zobrist is not None:
+            self._zobrist.value ^= self._zobrist_key
+
+        self._zobrist = zobrist
+        if zobrist is not None:
+            self._zobrist_index = zobrist.index(self.location)
+            self._zobrist_key = self._get_hash_key()
+            zobrist.value ^= self._zobrist_key
+
     @property
     def pushed(self) -> bool:
         return self._state.pushed
@@ -76,7 +97,25 @@ class Tumbler:
                 height += self.post_release_height
 
         self._state.counter_height = self._counter.height if self._counter is not None else 0
+        previous_height = self._state.current_height
         self._state.current_height = max(1, min(height, self.max_height - self._state.counter_height))
+        if self.listeners and self._state.current_height != previous_height:
+            for listener in self.listeners:
+                listener(self)
+
+        self._update_hash()
+
+    def _update_hash(self):
+        if self._zobrist is not None:
+            key = self._get_hash_key()
+            self._zobrist.value ^= self._zobrist_key ^ key
+            self._zobrist_key = key
+
+    def _get_hash_key(self) -> int:
+        state = self._state
+        return self._zobrist.tumbler_key(
+            self._zobrist_index, state.current_height, state.pushed, state.jammed, state.release, state.difference
+        )
 
     @property
     def base_height(self) -> int:
@@ -152,6 +191,8 @@ class Tumbler:
         self._state.difference = difference
         if recalculate:
             self._recalculate_current_height()
+        else:
+            self._update_hash()
 
     @property
     def max_height(self) -> int:
@@ -2,14 +2,14 @@ import argparse
 from pathlib import Path
 from typing import Optional
 
-import pygame
-
+from lockpicker.agents.parallel import play_parallel_random_games
 from lockpicker.agents.random import play_random_games
-from lockpicker.constants.gui import HEIGHT, WIDTH
-from lockpicker.game.editor import Editor
-from lockpicker.game.game import Game
+from lockpicker.array_lock import ArrayLock
+from lockpicker.constants.gui import FPS, HEIGHT, WIDTH
 from lockpicker.level import MAX_HEIGHT, NUMBER_OF_PICKS
 from lockpicker.lock import Level, Lock
+from lockpicker.solver.heuristics import HEURISTICS
+from lockpicker.solver.solve import SOLVERS, solve
 
 
 def load_level(path: Path, number_of_picks: Optional[int], max_height: Optional[int]) -> Level:
@@ -32,18 +32,50 @@ def main():
     parser.add_argument("--number_of_picks", type=int, default=NUMBER_OF_PICKS, help="Number of picks (at least 1)")
     parser.add_argument("--max_height", type=int, default=MAX_HEIGHT, help="Maximum height (at least 2)")
     parser.add_argument("--random_agent", action="store_true", help="Random simulation agent")
+    parser.add_argument("--replay", action="store_true", help="Replay the winning trace of the agent or solver")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes for the random agent")
+    parser.add_argument("--seed", type=int, default=None, help="Master seed for the parallel random agent")
+    parser.add_argument("--batch_agent", action="store_true", help="Estimate the random solve rate with NumPy playouts")
+    parser.add_argument("--solve", action="store_true", help="Find the shortest solution")
+    parser.add_argument("--solver", choices=SOLVERS, default="bfs", help="Search algorithm for --solve")
+    parser.add_argument("--heuristic", choices=list(HEURISTICS), default="unsolved", help="Heuristic for A* and IDA*")
+    parser.add_argument("--array_engine", action="store_true", help="Use the array-backed engine for agents and solver")
+    parser.add_argument("--fps", type=int, default=FPS, help="Frame rate cap (0 for uncapped)")
     args = parser.parse_args()
 
     path = Path(args.level_file)
     lock = Lock(load_level(path, number_of_picks=args.number_of_picks, max_height=args.max_height))
 
-    if args.random_agent:
-        print(play_random_games(lock))
+    if args.batch_agent:
+        from lockpicker.agents.batch import estimate_solve_rate
+
+        print(estimate_solve_rate(lock.level))
         return
 
+    moves = None
+    if args.random_agent and args.workers > 1:
+        lock_class = ArrayLock if args.array_engine else Lock
+        result = play_parallel_random_games(lock.level, workers=args.workers, seed=args.seed, lock_class=lock_class)
+        print(result)
+        moves = result.trace
+    elif args.random_agent or args.solve:
+        engine = ArrayLock(lock.level) if args.array_engine else lock
+        result = play_random_games(engine) if args.random_agent else solve(engine, args.solver, args.heuristic)
+        print(result)
+        moves = result.trace if args.random_agent else result.moves
+        lock.reset()
+
+    if (args.random_agent or args.solve) and not (args.replay and moves):
+        return
+
+    import pygame
+
+    from lockpicker.game.editor import Editor
+    from lockpicker.game.game import Game
+
     def run_game():
         lock_copy = Lock(lock.level.copy())
-        game = Game(screen, lock_copy, random_moves=args.random_moves)
+        game = Game(screen, lock_copy, random_moves=args.random_moves, moves=moves, fps=args.fps)
         game.run()
 
     pygame.init()
@@ -51,7 +83,7 @@ def main():
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
 
     if args.edit:
-        editor = Editor(screen, lock, path, run_game)
+        editor = Editor(screen, lock, path, run_game, fps=args.fps)
         editor.run()
     else:
         run_game()
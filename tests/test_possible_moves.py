@@ -0,0 +1,54 @@
+import numpy as np
+
+from lockpicker.array_lock import ArrayLock
+from lockpicker.batch_lock import BatchLock
+from lockpicker.level.level import Level
+from lockpicker.lock import Lock
+from lockpicker.tumbler.base import BaseTumbler
+from lockpicker.tumbler.location import Location
+from lockpicker.tumbler.tumbler import Tumbler
+
+LOCATION = Location(0, True)
+
+
+def create_level() -> Level:
+    master = Location(1, True)
+    tumblers = {
+        LOCATION: Tumbler(BaseTumbler(LOCATION, 0, 3, 5, 2, False)),
+        master: Tumbler(BaseTumbler(master, 0, 2, 5, 0, True)),
+    }
+    return Level(1, 5, tumblers, {})
+
+
+def raise_to_max_height(lock):
+    lock.select_pick(0)
+    lock.push(LOCATION)
+    lock.release_current_pick()
+
+
+def test_lock_keeps_max_height_tumbler_without_counter():
+    lock = Lock(create_level())
+    raise_to_max_height(lock)
+
+    assert lock.get_tumbler(LOCATION).height == 5
+    assert lock.get_possible_moves() == [LOCATION]
+
+
+def test_array_lock_keeps_max_height_tumbler_without_counter():
+    lock = ArrayLock(create_level())
+    raise_to_max_height(lock)
+
+    assert lock.get_possible_moves() == [LOCATION]
+
+
+def test_batch_lock_keeps_max_height_tumbler_without_counter():
+    lock = BatchLock(create_level(), 1, seed=0)
+    lock.reset()
+    rows = np.zeros(1, dtype=np.intp)
+    index = np.array([lock.get_index(LOCATION)])
+    lock.push(rows, index)
+    lock.release_current_pick(rows)
+
+    assert lock.get_number_of_moves().tolist() == [1]
+    lock.push(rows, index)
+    assert lock.get_number_of_moves().tolist() == [2]